@@ -0,0 +1,68 @@
+"""
+Shared CSV loading for the analysis scripts.
+
+`read_csv_columns` reads with pyarrow's multithreaded parser, typed as
+`pd.read_csv(path, engine="pyarrow", usecols=...)` types the columns, except
+that quoted values may contain newlines. pandas cannot pass that option to
+Arrow, and without it a multi-line cell that crosses a parse block (~1 MB)
+makes the read fail. Missing values are NaN, as with the default pandas
+engine the scripts used before (Arrow's string nulls would be None).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# Missing-value tokens of pd.read_csv (keep_default_na=True), which is what
+# the pyarrow engine passes to Arrow as null_values
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+
+def read_csv_columns(path: Path | str, usecols: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Read `usecols` (every column if None) from a CSV file with pyarrow.
+
+    Parameters
+    ----------
+    path : Path or str
+        Input CSV file.
+    usecols : iterable of str, optional
+        Columns to parse; the others are skipped by the parser.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns typed as the pandas pyarrow engine types them (all-null
+        columns become float64); missing values are NaN.
+    """
+    table = pacsv.read_csv(
+        path,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=None if usecols is None else list(usecols),
+            null_values=PANDAS_NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    # Same as pandas: an all-null column is read as float64 (NaN)
+    schema = table.schema
+    for i, arrow_type in enumerate(schema.types):
+        if pa.types.is_null(arrow_type):
+            schema = schema.set(i, schema.field(i).with_type(pa.float64()))
+    df = table.cast(schema).to_pandas()
+    # String nulls come back as None; make them NaN like pd.read_csv does, so
+    # e.g. astype(str) still yields "nan" for a missing cell
+    for col in df.columns[df.dtypes == object]:
+        if df[col].isna().any():
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
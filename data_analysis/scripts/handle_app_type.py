@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
+import re
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+
+from csv_utils import read_csv_columns
 
 INPUT = Path("../dataset/[Empirical Study]-sa_doc(70).csv")
 OUT_DIR_FIG = Path("../results/figs")
@@ -25,9 +30,28 @@ plt.rcParams.update({
 # Ordem final padronizada
 ORDER = ["Meta-Architecture", "Platform/Infrastructure", "System", "Subsystem"]
 
+# Heurística meta vs platform para rótulos 'framework'
+META_KEYS = [
+    "42010", "reference architecture", "viewpoint", "viewpoints",
+    "metamodel", "iso 30141", "30141", "togaf", "dodaf", "adl",
+    "architecture description", "architecture framework", "reference model",
+    " ra ", " ra:", " ra-", " ra/", "model-driven"
+]
+PLAT_KEYS = [
+    "ros", "ros2", "kubernetes", "triton", "tensorrt", "tensorflow",
+    "pytorch", "sdk", "runtime", "broker", "mqtt", "kafka", "grpc",
+    "onnx", "inference", "edge", "jetson", "cuda", "rcl", "operator",
+    "operator-sdk", "helm", "microservice", "deployment"
+]
+PLATFORM_LABELS = {"platform", "platform/framework", "framework/platform"}
+
+# Alternações compiladas uma única vez (equivalem aos testes `k in n`)
+META_RE = re.compile("|".join(map(re.escape, META_KEYS)))
+PLAT_RE = re.compile("|".join(map(re.escape, PLAT_KEYS)))
+
 def _str(x) -> str:
     """Coerção segura para string, evitando NaN/None/numéricos."""
-    return x if isinstance(x, str) else ""
+    return x if type(x) is str else ""
 
 def normalize_label(raw: str) -> str:
     s = _str(raw).strip().lower().replace("_", " ").replace("-", "")
@@ -51,34 +75,76 @@ def map_arch_layer(label: str, name_hint: str = "") -> str:
         return "System"
     if l == "subsystem":
         return "Subsystem"
-    if l in {"platform", "platform/framework", "framework/platform"}:
+    if l in PLATFORM_LABELS:
         return "Platform/Infrastructure"
     if l == "framework":
         # Heurística: meta vs platform
-        meta_keys = [
-            "42010", "reference architecture", "viewpoint", "viewpoints",
-            "metamodel", "iso 30141", "30141", "togaf", "dodaf", "adl",
-            "architecture description", "architecture framework", "reference model",
-            " ra ", " ra:", " ra-", " ra/", "model-driven"
-        ]
-        plat_keys = [
-            "ros", "ros2", "kubernetes", "triton", "tensorrt", "tensorflow",
-            "pytorch", "sdk", "runtime", "broker", "mqtt", "kafka", "grpc",
-            "onnx", "inference", "edge", "jetson", "cuda", "rcl", "operator",
-            "operator-sdk", "helm", "microservice", "deployment"
-        ]
-        if any(k in n for k in meta_keys):
+        if META_RE.search(n):
             return "Meta-Architecture"
-        if any(k in n for k in plat_keys):
+        if PLAT_RE.search(n):
             return "Platform/Infrastructure"
         return "Platform/Infrastructure"
 
     return "System"
 
+def normalize_labels(raw: pd.Series) -> pd.Series:
+    """Versão vetorizada de `normalize_label` (não-strings viram "")."""
+    s = raw.str.strip().str.lower()
+    s = s.str.replace("_", " ", regex=False).str.replace("-", "", regex=False)
+    for old, new in [("full system", "system"), ("sub system", "subsystem"),
+                     ("sub-sistema", "subsystem"), ("sistema", "system"),
+                     ("plataforma", "platform")]:
+        s = s.str.replace(old, new, regex=False)
+    return s.fillna("")
+
+def map_arch_layers(labels: pd.Series, name_hints: pd.Series | None = None) -> pd.Series:
+    """
+    Versão vetorizada de `map_arch_layer`: resolve a coluna inteira com
+    máscaras booleanas + np.select, sem chamada Python por linha.
+    Retorna um Categorical ordenado segundo ORDER.
+    """
+    l = normalize_labels(labels)
+    if name_hints is None:
+        n = pd.Series("", index=labels.index)
+    else:
+        n = name_hints.astype(object).str.lower().fillna("")
+
+    # Só as linhas 'framework' precisam da pista textual; e como PLAT_KEYS e
+    # "nenhuma pista" levam ambos a Platform, basta testar META_RE nelas.
+    is_framework = l.eq("framework")
+    is_meta = (
+        n[is_framework].str.contains(META_RE)
+        .reindex(labels.index, fill_value=False)
+        .astype(bool)
+    )
+    conds = [
+        l.eq("system"),
+        l.eq("subsystem"),
+        l.isin(PLATFORM_LABELS),
+        is_meta,
+        is_framework,
+    ]
+    # Códigos = posições em ORDER, usados direto no Categorical
+    choices = [
+        ORDER.index("System"),
+        ORDER.index("Subsystem"),
+        ORDER.index("Platform/Infrastructure"),
+        ORDER.index("Meta-Architecture"),
+        ORDER.index("Platform/Infrastructure"),
+    ]
+    codes = np.select(conds, choices, default=ORDER.index("System")).astype(np.int8)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=ORDER, ordered=True),
+        index=labels.index,
+    )
+
 # =========================
 # Carrega e trata o dataset
 # =========================
-df = pd.read_csv(INPUT)
+# Lê só as colunas usadas (parser multithread do Arrow; aceita quebras de
+# linha dentro de células entre aspas)
+header = pd.read_csv(INPUT, nrows=0).columns
+df = read_csv_columns(INPUT, [c for c in ("application_type", "desc.") if c in header])
 
 # Checagem correta da coluna usada
 if "application_type" not in df.columns:
@@ -90,32 +156,23 @@ df = df.dropna(subset=["application_type"]).copy()
 # Usa 'desc.' (se existir) como pista textual
 hint_col = "desc." if "desc." in df.columns else None
 
-# AQUI estava o bug: garantir coerção str antes da heurística
-if hint_col:
-    df["Architectural Layer"] = df.apply(
-        lambda r: map_arch_layer(r["application_type"], _str(r.get(hint_col, ""))),
-        axis=1
-    )
-else:
-    df["Architectural Layer"] = df.apply(
-        lambda r: map_arch_layer(r["application_type"]),
-        axis=1
-    )
-
-# Categoria ordenada & alinhada à ORDER
-df["Architectural Layer"] = pd.Categorical(df["Architectural Layer"], categories=ORDER, ordered=True)
+# Coerção str é feita dentro de map_arch_layers (não-strings viram "")
+df["Architectural Layer"] = map_arch_layers(
+    df["application_type"], df[hint_col] if hint_col else None
+)
 
-# Contagens + percentuais
-counts = df["Architectural Layer"].value_counts(dropna=False).reindex(ORDER).fillna(0).astype(int)
+# Contagens + percentuais (a coluna já é categórica, alinhada à ORDER)
+codes = df["Architectural Layer"].cat.codes.to_numpy()
+counts = pd.Series(np.bincount(codes, minlength=len(ORDER)), index=ORDER)
 total = int(counts.sum())
-perc = (counts / total * 100.0).round(1)
+perc = counts.mul(100.0).div(total).round(1)
 
 # Salva tabela
 out_counts = pd.DataFrame({"Layer": ORDER, "Count": counts.values, "Percent": perc.values})
 out_counts.to_csv(CSV_COUNTS_PATH, index=False)
 
 # Plot
-fig, ax = plt.subplots()
+fig, ax = plt.subplots(layout="constrained")
 # paleta com 4 cores → casa com ORDER de 4 itens
 colors = ["#3b5b92", "#6c8ebf", "#888888", "#b0b0b0"]
 bars = ax.bar(ORDER, counts.values, color=colors, edgecolor="#222222", linewidth=0.8)
@@ -124,17 +181,13 @@ ax.set_xlabel("Application Type (Normalized)")
 ax.set_ylabel("Frequency")
 ax.grid(axis="y")
 
-for rect, c, p in zip(bars, counts.values, perc.values):
-    height = rect.get_height()
-    label = f"{c} ({p:.1f}%)" if total > 0 else "0 (0%)"
-    ax.annotate(label, xy=(rect.get_x() + rect.get_width()/2, height),
-                xytext=(0, 5), textcoords="offset points",
-                ha="center", va="bottom", fontsize=9)
+labels = [f"{c} ({p:.1f}%)" if total > 0 else "0 (0%)" for c, p in zip(counts.values, perc.values)]
+ax.bar_label(bars, labels=labels, padding=5, fontsize=9)
 
 plt.setp(ax.get_xticklabels(), rotation=0, ha="center")
-fig.tight_layout()
 fig.savefig(PNG_PATH, dpi=300, bbox_inches="tight")
-fig.savefig(PDF_PATH, bbox_inches="tight")
+with PdfPages(PDF_PATH) as pdf:
+    pdf.savefig(fig, bbox_inches="tight")
 
 print(f"[OK] Figura salva em:\n - {PNG_PATH}\n - {PDF_PATH}")
 print(f"[OK] Tabela de contagens salva em:\n - {CSV_COUNTS_PATH}")
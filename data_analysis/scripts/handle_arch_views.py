@@ -28,9 +28,14 @@ from pathlib import Path
 import argparse
 import logging
 import sys
-from typing import Iterable
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from csv_utils import PANDAS_NA_VALUES
 
 COLUMNS = [
     "arch_overview", "diagrams", "adrs", "context",
@@ -39,6 +44,14 @@ COLUMNS = [
 
 TRUE_LIKE_SET = {"true", "1", "yes", "y", "sim"}
 
+# Tokens read as missing: pandas' default NA strings (keep_default_na=True,
+# which include "<NA>" and "None") cover the explicit na_values
+# ("", "NA", "NaN", "null", "None") of the former pd.read_csv call
+NA_VALUES = PANDAS_NA_VALUES
+
+# Bytes of CSV parsed per chunk when streaming the input
+CHUNK_BYTES = 64 << 20
+
 
 def setup_logging(level: str = "INFO") -> None:
     logging.basicConfig(
@@ -48,6 +61,9 @@ def setup_logging(level: str = "INFO") -> None:
 
 
 def is_true_like(val) -> bool:
+    if type(val) is float:
+        # NaN != NaN, so this also covers missing cells
+        return val == val and val != 0
     if pd.isna(val):
         return False
     if isinstance(val, (int, float)):
@@ -60,6 +76,8 @@ def is_true_like(val) -> bool:
 
 
 def is_non_empty(val) -> bool:
+    if type(val) is float:
+        return val == val
     if pd.isna(val):
         return False
     if isinstance(val, str):
@@ -68,19 +86,85 @@ def is_non_empty(val) -> bool:
     return True
 
 
-def compute_coverage(
-        df: pd.DataFrame, columns: Iterable[str], true_like: bool = False
+def count_true_like(series: pd.Series) -> int:
+    """Vectorized `is_true_like(...).sum()` over a column."""
+    if pd.api.types.is_numeric_dtype(series):
+        return int(series.fillna(0).ne(0).sum())
+    series = series.astype(object)
+    stripped = series.str.strip()
+    text_hits = stripped.str.lower().isin(TRUE_LIKE_SET).sum()
+    # numbers stored in object columns: non-zero counts as true
+    others = series[stripped.isna() & series.notna()]
+    num_hits = pd.to_numeric(others, errors="coerce").fillna(0).ne(0).sum()
+    return int(text_hits + num_hits)
+
+
+def count_non_empty(series: pd.Series) -> int:
+    """Vectorized `is_non_empty(...).sum()` over a column."""
+    if pd.api.types.is_numeric_dtype(series):
+        return int(series.notna().sum())
+    stripped = series.astype(object).str.strip()
+    return int((series.notna() & stripped.ne("")).sum())
+
+
+def iter_column_chunks(
+        path: Path, sep: str, columns: Iterable[str], block_size: int = CHUNK_BYTES
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream only `columns` (those present in the header) as strings with pyarrow.
+
+    Yields one DataFrame per parsed block of about `block_size` bytes, so only
+    one chunk is resident at a time. Unused columns are skipped by the parser;
+    missing ones are left out so the coverage step can report them. A file
+    with a header and no rows yields a single empty frame.
+    """
+    # Quoted cells may contain newlines (free-text answers), also across blocks
+    parse_options = pacsv.ParseOptions(delimiter=sep, newlines_in_values=True)
+    header = pacsv.open_csv(path, parse_options=parse_options).schema.names
+    present = [c for c in columns if c in header]
+    # An empty include list means "all columns" to Arrow; read the first one
+    # instead so the row count is still available.
+    include = present or header[:1]
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        parse_options=parse_options,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=include,
+            column_types={c: pa.string() for c in include},
+            strings_can_be_null=True,
+            null_values=NA_VALUES,
+        ),
+    )
+    empty = True
+    for batch in reader:
+        empty = False
+        yield batch.to_pandas()[present]
+    if empty:
+        yield reader.schema.empty_table().to_pandas()[present]
+
+
+def coverage_from_chunks(
+        chunks: Iterable[pd.DataFrame], columns: Iterable[str], true_like: bool = False
 ) -> pd.DataFrame:
-    total = len(df)
-    checker = is_true_like if true_like else is_non_empty
+    """Accumulate per-column counts over `chunks` and build the coverage table."""
+    columns = list(columns)
+    counter = count_true_like if true_like else count_non_empty
+
+    counts = np.zeros(len(columns), dtype=np.int64)
+    total = 0
+    seen: set[str] = set()
+    for chunk in chunks:
+        total += len(chunk)
+        for i, col in enumerate(columns):
+            if col in chunk.columns:
+                seen.add(col)
+                counts[i] += counter(chunk[col])
 
     rows = []
-    for col in columns:
-        if col not in df.columns:
+    for col, count in zip(columns, counts):
+        if col not in seen:
             logging.warning("Column '%s' not found in input. Counting as zero.", col)
-            count = 0
-        else:
-            count = df[col].apply(checker).sum()
         percentage = (count / total * 100.0) if total > 0 else 0.0
         rows.append(
             {
@@ -94,6 +178,12 @@ def compute_coverage(
     return pd.DataFrame(rows, columns=["column", "count", "percentage", "total_rows", "criterion"])
 
 
+def compute_coverage(
+        df: pd.DataFrame, columns: Iterable[str], true_like: bool = False
+) -> pd.DataFrame:
+    return coverage_from_chunks([df], columns, true_like=true_like)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Compute per-column coverage (count & percent).")
     parser.add_argument("--input", required=True, help="Path to input CSV file.")
@@ -115,18 +205,17 @@ def main():
         logging.error("Input file not found: %s", in_path)
         sys.exit(1)
 
+    # Stream the CSV and compute coverage chunk by chunk
     logging.info("Loading CSV: %s", in_path)
     try:
-        df = pd.read_csv(in_path, sep=args.sep, dtype=object, keep_default_na=True,
-                         na_values=["", "NA", "NaN", "null", "None"])
+        coverage = coverage_from_chunks(
+            iter_column_chunks(in_path, args.sep, COLUMNS), COLUMNS, true_like=args.true_like
+        )
     except Exception as e:
         logging.exception("Failed to read CSV: %s", e)
         sys.exit(1)
 
-    logging.info("Rows loaded: %d | Columns: %d", len(df), len(df.columns))
-
-    # Compute coverage
-    coverage = compute_coverage(df, COLUMNS, true_like=args.true_like)
+    logging.info("Rows loaded: %d", int(coverage["total_rows"].iat[0]) if len(coverage) else 0)
 
     # Save
     coverage.to_csv(out_path, index=False)
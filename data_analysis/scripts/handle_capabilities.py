@@ -30,7 +30,7 @@ Notes:
     into multiple rows with fractional weight (sum of weights per slot = 1).
   - Any column starting with 'iso' or 'iso_map' is interpreted as ISO mapping;
     'layer_caps' (or close variants) is interpreted as layer mapping.
-  - Dependencies: pandas, matplotlib.
+  - Dependencies: pandas, pyarrow, matplotlib.
 """
 
 from __future__ import annotations
@@ -39,10 +39,14 @@ from pathlib import Path
 import re
 import unicodedata
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.colors import LinearSegmentedColormap
 
+from csv_utils import read_csv_columns
+
 # =========================
 # Paths and configuration
 # =========================
@@ -71,18 +75,49 @@ colors = ["#3b5b92", "#6c8ebf", "#8aa8d6", "#b7c7ea",
 # Canonical layer order
 LAYER_CANON = ["Device", "Edge", "Fog", "Cloud", "Cross-cutting"]
 
+# Accepted input column names (first match wins); slot columns are "<prefix>_<n>"
+ID_COLS = ["id", "repo_id", "uid"]
+REPO_COLS = ["repo_name", "repo", "name"]
+LAYER_COLS = ["layer_caps", "layers_cap", "layers_caps", "layer"]
+CAP_PREFIXES = ["capability", "cap"]
+ISO_PREFIXES = ["iso_mapping_cap", "iso_map", "iso_mapping", "iso", "iso_ns"]
+SLOTS = (1, 2, 3)
+
+INPUT_COLS = {
+    *ID_COLS, *REPO_COLS, *LAYER_COLS,
+    *(f"{p}_{n}" for p in CAP_PREFIXES + ISO_PREFIXES for n in SLOTS),
+}
+
 
 # -------------------------
 # Helper functions
 # -------------------------
+# Single-pass ASCII folding for the accents found in the study tables; "↔"
+# is deleted, as the NFKD fold did, not turned into a separator
+_ACCENT_TABLE = str.maketrans(
+    "áàâãäéêíóôõúüçÁÀÂÃÄÉÊÍÓÔÕÚÜÇ",
+    "aaaaaeeiooouucAAAAAEEIOOOUUC",
+    "↔",
+)
+_WS_RE = re.compile(r"\s+")
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _to_ascii(s: str) -> str:
+    """Drop anything non-ASCII left after the translate table (NFKD fold)."""
+    return unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
+
+
 def norm_basic(s: str | float) -> str:
     """Basic string normalization: trim, collapse spaces, strip punctuation, remove accents."""
     if not isinstance(s, str):
         return ""
     s = s.strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     s = s.strip(",.;:|-_/")
-    s = unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
+    s = s.translate(_ACCENT_TABLE)
+    if not s.isascii():
+        s = _to_ascii(s)
     return s
 
 
@@ -136,6 +171,42 @@ def normalize_iso(raw: str) -> str | None:
     return None
 
 
+# Literal spellings seen in the coding sheet, keyed by lowercased `norm_basic`
+# output. Anything else goes through the keyword rules of `normalize_iso`.
+ISO_MAP = {
+    "interface capability": "Interface Capability",
+    "interface capabilities": "Interface Capability",
+    "data capability": "Data Capabilities",
+    "data capabilities": "Data Capabilities",
+    "supporting capability": "Supporting Capabilities",
+    "supporting capabilities": "Supporting Capabilities",
+}
+
+
+def normalize_iso_series(raw: pd.Series) -> pd.Series:
+    """
+    Column-wise equivalent of `normalize_iso`.
+
+    Known spellings are resolved with a dictionary lookup; only the remaining
+    non-empty values are scanned for the interface/data/support keywords.
+    The canonical-label fallback is not needed here: every canonical label
+    already contains one of the three keywords.
+    """
+    s_low = norm_basic_series(raw).str.lower()
+    iso = s_low.map(ISO_MAP).astype(object)
+
+    rest = s_low[iso.isna() & s_low.ne("")]
+    # Assigned lowest-priority first so that "interface" wins over "data",
+    # which wins over "support", as in the scalar version.
+    for word, canon in (
+        ("support", "Supporting Capabilities"),
+        ("data", "Data Capabilities"),
+        ("interface", "Interface Capability"),
+    ):
+        iso.loc[rest.index[rest.str.contains(word, regex=False)]] = canon
+    return iso.where(iso.notna(), None)
+
+
 # -------------------------
 # Layer normalization
 # -------------------------
@@ -161,6 +232,39 @@ _LAYER_PATTERNS = {
     ],
 }
 
+# Common combinations (plain substring tests)
+_LAYER_COMBOS = {
+    "device/edge": ["Device", "Edge"],
+    "edge/device": ["Device", "Edge"],
+    "edge/fog": ["Edge", "Fog"],
+    "fog/edge": ["Edge", "Fog"],
+    "fog/cloud": ["Fog", "Cloud"],
+    "cloud/fog": ["Fog", "Cloud"],
+    "edge/fog/cloud": ["Edge", "Fog", "Cloud"],
+    "device/edge/fog": ["Device", "Edge", "Fog"],
+    "device/edge/fog/cloud": ["Device", "Edge", "Fog", "Cloud"],
+    "device ↔ fog": ["Device", "Edge", "Fog"],
+}
+
+# One compiled alternation per canonical layer (input is already lowercase)
+LAYER_RES = {
+    layer: re.compile("|".join(pats)) for layer, pats in _LAYER_PATTERNS.items()
+}
+_TO_RE = re.compile(r"\bto\b", re.I)
+_LAYER_WORD_RE = re.compile(r"\blayer\b")
+
+# Layer sets encoded as bitmasks (bit i <-> LAYER_CANON[i]); the lookup table
+# decodes every possible mask into its ordered layer list (None for 0).
+LAYER_BITS = {layer: 1 << i for i, layer in enumerate(LAYER_CANON)}
+_COMBO_BITS = {
+    k: sum(LAYER_BITS[layer] for layer in layers) for k, layers in _LAYER_COMBOS.items()
+}
+BITS_TO_LAYERS = np.empty(1 << len(LAYER_CANON), dtype=object)
+BITS_TO_LAYERS[:] = [
+    [layer for layer, bit in LAYER_BITS.items() if fp & bit] or None
+    for fp in range(len(BITS_TO_LAYERS))
+]
+
 
 def split_layers(raw: str) -> list[str] | None:
     """
@@ -182,20 +286,7 @@ def split_layers(raw: str) -> list[str] | None:
     found: set[str] = set()
 
     # Common combinations
-    combos = {
-        "device/edge": ["Device", "Edge"],
-        "edge/device": ["Device", "Edge"],
-        "edge/fog": ["Edge", "Fog"],
-        "fog/edge": ["Edge", "Fog"],
-        "fog/cloud": ["Fog", "Cloud"],
-        "cloud/fog": ["Fog", "Cloud"],
-        "edge/fog/cloud": ["Edge", "Fog", "Cloud"],
-        "device/edge/fog": ["Device", "Edge", "Fog"],
-        "device/edge/fog/cloud": ["Device", "Edge", "Fog", "Cloud"],
-        "device ↔ fog": ["Device", "Edge", "Fog"],
-    }
-
-    for k, layers in combos.items():
+    for k, layers in _LAYER_COMBOS.items():
         if k in s_low:
             found.update(layers)
 
@@ -216,12 +307,52 @@ def split_layers(raw: str) -> list[str] | None:
     return ordered or None
 
 
+def norm_basic_series(raw: pd.Series) -> pd.Series:
+    """Column-wise equivalent of `norm_basic` (non-strings become "")."""
+    s = raw.astype(object).str.strip().str.replace(_WS_RE, " ", regex=True)
+    s = s.str.strip(",.;:|-_/").str.translate(_ACCENT_TABLE)
+    non_ascii = s.str.contains(_NON_ASCII_RE, na=False)
+    if non_ascii.any():
+        s[non_ascii] = s[non_ascii].map(_to_ascii)
+    return s.fillna("")
+
+
+def split_layers_series(raw: pd.Series) -> pd.Series:
+    """
+    Column-wise equivalent of `split_layers`.
+
+    Runs one compiled regex scan per canonical layer over the whole column,
+    ORs the hits into a per-row bitmask and decodes it into ordered layer
+    lists through `BITS_TO_LAYERS` (None where no layer was detected).
+    """
+    s = norm_basic_series(raw)
+    s = s.str.replace("↔", "/", regex=False).str.replace("\\", "/", regex=False)
+    s = s.str.replace(_TO_RE, "/", regex=True)
+    s = s.str.replace(r"[;,|]+", "/", regex=True)
+    s = s.str.replace(r"\s*/\s*", "/", regex=True)
+    s = s.str.lower()
+
+    fp = np.zeros(len(s), dtype=np.uint8)
+    for layer, rx in LAYER_RES.items():
+        fp[s.str.contains(rx).to_numpy(dtype=bool)] |= LAYER_BITS[layer]
+    for k, bits in _COMBO_BITS.items():
+        fp[s.str.contains(k, regex=False).to_numpy(dtype=bool)] |= bits
+
+    # Fallback: if we see "layer" but no specific match, assume "Edge"
+    fallback = (fp == 0) & s.str.contains(_LAYER_WORD_RE).to_numpy(dtype=bool)
+    fp[fallback] = LAYER_BITS["Edge"]
+
+    return pd.Series(BITS_TO_LAYERS[fp], index=raw.index, dtype=object)
+
+
 # -------------------------
 # Data loading and melting
 # -------------------------
 def load_input(path: Path) -> pd.DataFrame:
-    """Load input CSV and strip column names."""
-    df = pd.read_csv(path)
+    """Load the columns used by `melt_and_normalize` and strip column names."""
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [c for c in header if c.strip() in INPUT_COLS]
+    df = read_csv_columns(path, usecols)
     df.columns = [c.strip() for c in df.columns]
     return df
 
@@ -239,68 +370,75 @@ def melt_and_normalize(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd
                 return cand
         return None
 
-    def get_layer_unified_colname() -> str | None:
-        for name in ["layer_caps", "layers_cap", "layers_caps", "layer"]:
+    def first_col(names: list[str]) -> str | None:
+        for name in names:
             if name in df.columns:
                 return name
         return None
 
-    layer_unified = get_layer_unified_colname()
-
-    records: list[dict] = []
-    unmapped_iso: list[dict] = []
-    unmapped_layers: list[dict] = []
-
-    for _, row in df.iterrows():
-        rid = row.get("id") or row.get("repo_id") or row.get("uid")
-        repo = row.get("repo_name") or row.get("repo") or row.get("name")
-        layer_raw_base = row.get(layer_unified, "") if layer_unified else ""
-
-        for n in (1, 2, 3):
-            cap_col = col_for(["capability", "cap"], n)
-            iso_col = col_for(["iso_mapping_cap", "iso_map", "iso_mapping", "iso", "iso_ns"], n)
-
-            cap = row.get(cap_col, "") if cap_col else ""
-            iso_raw = row.get(iso_col, "") if iso_col else ""
-            layer_raw = layer_raw_base
-
-            # Skip completely empty slots
-            if not (str(cap).strip() or str(iso_raw).strip() or str(layer_raw).strip()):
-                continue
-
-            iso_norm = normalize_iso(iso_raw)
-            if iso_norm is None and str(iso_raw).strip():
-                unmapped_iso.append(
-                    {"id": rid, "repo_name": repo, "slot": n, "iso_raw": iso_raw}
-                )
-
-            layers = split_layers(layer_raw)
-            if layers is None and str(layer_raw).strip():
-                unmapped_layers.append(
-                    {"id": rid, "repo_name": repo, "slot": n, "layer_raw": layer_raw}
-                )
-
-            layers = layers or [None]
-            weight = 1.0 / len(layers) if layers[0] is not None else 1.0
-
-            for lyr in layers:
-                records.append(
-                    {
-                        "id": rid,
-                        "repo_name": repo,
-                        "slot": n,
-                        "cap_specific": str(cap).strip(),
-                        "iso_raw": iso_raw,
-                        "iso": iso_norm,
-                        "layer_raw": layer_raw,
-                        "layer": lyr,
-                        "weight": weight,
-                    }
-                )
-
-    long_df = pd.DataFrame.from_records(records)
-    unm_iso_df = pd.DataFrame(unmapped_iso).drop_duplicates()
-    unm_layer_df = pd.DataFrame(unmapped_layers).drop_duplicates()
+    def stripped(col: str | None) -> pd.Series | str:
+        return df[col].astype(str).str.strip() if col else ""
+
+    layer_unified = first_col(LAYER_COLS)
+    id_col = first_col(ID_COLS)
+    repo_col = first_col(REPO_COLS)
+
+    # Per-row columns shared by the three capability slots; the stripped text
+    # columns (_*_s) are computed once per source column and reused below.
+    base = pd.DataFrame(
+        {
+            "id": df[id_col] if id_col else None,
+            "repo_name": df[repo_col] if repo_col else None,
+            "layer_raw": df[layer_unified] if layer_unified else "",
+            "_layer_s": stripped(layer_unified),
+            "layers": split_layers_series(df[layer_unified]) if layer_unified else None,
+            "_row": np.arange(len(df)),
+        },
+        index=df.index,
+    )
+
+    # One sub-frame per slot, stacked vertically (row-major order restored below)
+    parts = []
+    for n in SLOTS:
+        cap_col = col_for(CAP_PREFIXES, n)
+        iso_col = col_for(ISO_PREFIXES, n)
+        parts.append(
+            base.assign(
+                slot=n,
+                iso_raw=df[iso_col] if iso_col else "",
+                cap_specific=stripped(cap_col),
+                _iso_s=stripped(iso_col),
+            )
+        )
+    long = (
+        pd.concat(parts, ignore_index=True)
+        .sort_values("_row", kind="stable")
+        .reset_index(drop=True)
+    )
+
+    # Skip completely empty slots
+    keep = long[["cap_specific", "_iso_s", "_layer_s"]].ne("").any(axis=1)
+    long = long[keep].copy()
+
+    long["iso"] = normalize_iso_series(long["iso_raw"])
+
+    unm_iso_df = long.loc[
+        long["iso"].isna() & long["_iso_s"].ne(""), ["id", "repo_name", "slot", "iso_raw"]
+    ].drop_duplicates()
+    unm_layer_df = long.loc[
+        long["layers"].isna() & long["_layer_s"].ne(""), ["id", "repo_name", "slot", "layer_raw"]
+    ].drop_duplicates()
+
+    # Combined layers are exploded with fractional weight (sum per slot = 1)
+    long["weight"] = (1.0 / long["layers"].str.len().astype(float)).fillna(1.0)
+    long_df = (
+        long.rename(columns={"layers": "layer"})
+        .explode("layer")
+        .reset_index(drop=True)[
+            ["id", "repo_name", "slot", "cap_specific", "iso_raw",
+             "iso", "layer_raw", "layer", "weight"]
+        ]
+    )
 
     # Ordered categories
     long_df["iso"] = pd.Categorical(long_df["iso"], categories=ISO_CANON, ordered=True)
@@ -322,13 +460,18 @@ def make_tables(long_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
       - heat_percent: ISO x layer matrix (percentages of total weight)
     """
 
-    # ISO totals
+    # ISO totals: sum the observed groups, then list every canonical class
+    # in order (0 if it has no weight)
     by_iso = (
         long_df.dropna(subset=["iso"])
-        .groupby("iso", dropna=False, as_index=False)["weight"]
+        .groupby("iso", observed=True, sort=False)["weight"]
         .sum()
-        .rename(columns={"weight": "count"})
-        .sort_values(["iso"])
+        .reindex(
+            pd.CategoricalIndex(ISO_CANON, categories=ISO_CANON, ordered=True, name="iso"),
+            fill_value=0,
+        )
+        .rename("count")
+        .reset_index()
     )
     total_iso = by_iso["count"].sum()
     if total_iso > 0:
@@ -336,13 +479,18 @@ def make_tables(long_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
     else:
         by_iso["percent"] = 0.0
 
-    # Layer totals
+    # Layer totals: sum the observed groups, then list every canonical layer
+    # in order (0 if it has no weight)
     by_layer = (
         long_df.dropna(subset=["layer"])
-        .groupby("layer", dropna=False, as_index=False)["weight"]
+        .groupby("layer", observed=True, sort=False)["weight"]
         .sum()
-        .rename(columns={"weight": "count"})
-        .sort_values(["layer"])
+        .reindex(
+            pd.CategoricalIndex(LAYER_CANON, categories=LAYER_CANON, ordered=True, name="layer"),
+            fill_value=0,
+        )
+        .rename("count")
+        .reset_index()
     )
     total_layer = by_layer["count"].sum()
     if total_layer > 0:
@@ -351,14 +499,9 @@ def make_tables(long_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
         by_layer["percent"] = 0.0
 
     # ISO x Layer matrix (counts)
-    mat = (
-        long_df.dropna(subset=["iso", "layer"])
-        .groupby(["iso", "layer"], as_index=False)["weight"]
-        .sum()
-        .rename(columns={"weight": "count"})
-    )
+    both = long_df.dropna(subset=["iso", "layer"])
     heat_counts = (
-        mat.pivot(index="iso", columns="layer", values="count")
+        pd.crosstab(both["iso"], both["layer"], values=both["weight"], aggfunc="sum")
         .reindex(index=ISO_CANON, columns=LAYER_CANON)
         .fillna(0.0)
     )
@@ -381,70 +524,60 @@ def make_tables(long_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
 # -------------------------
 # Plotting helpers
 # -------------------------
-def plot_bar_iso(by_iso: pd.DataFrame, outfile_png: Path, outfile_pdf: Path) -> None:
+def _save_both(fig: plt.Figure, outfile_png: Path, outfile_pdf: Path) -> None:
+    """Write the figure as PNG and PDF."""
+    fig.savefig(outfile_png, dpi=FIG_DPI)
+    with PdfPages(outfile_pdf) as pdf:
+        pdf.savefig(fig)
+
+
+def _fresh_axes(fig: plt.Figure, figsize: tuple[float, float]) -> plt.Axes:
+    """Clear a reused figure, resize it and give it a single Axes."""
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig.add_subplot(111)
+
+
+def _count_pct_labels(table: pd.DataFrame) -> list[str]:
+    """Bar labels "count (xx.x%)"; empty bars get no label."""
+    return [
+        f"{h:.1f} ({pct:.1f}%)" if h > 0 else ""
+        for h, pct in zip(table["count"], table["percent"])
+    ]
+
+
+def plot_bar_iso(by_iso: pd.DataFrame, outfile_png: Path, outfile_pdf: Path, fig: plt.Figure) -> None:
     """Bar chart: ISO classes (counts) annotated with percentage."""
-    fig, ax = plt.subplots(figsize=(10, 5))
+    ax = _fresh_axes(fig, (10, 5))
     x = range(len(by_iso))
-    ax.bar(x, by_iso["count"].values, color=colors, edgecolor="#222222", linewidth=0.8)
+    bars = ax.bar(x, by_iso["count"].values, color=colors, edgecolor="#222222", linewidth=0.8)
     ax.set_xticks(x)
     ax.set_xticklabels(by_iso["iso"].astype(str), rotation=15, ha="right")
     ax.set_ylabel("Weighted count")
     ax.set_title("Distribution of Capabilities by ISO/IEC/IEEE 30141 Class")
 
     # Annotate bars with "count (xx.x%)"
-    for idx, p in enumerate(ax.patches):
-        h = p.get_height()
-        if h <= 0:
-            continue
-        pct = by_iso.iloc[idx]["percent"]
-        ax.annotate(
-            f"{h:.1f} ({pct:.1f}%)",
-            (p.get_x() + p.get_width() / 2, h),
-            ha="center",
-            va="bottom",
-            fontsize=9,
-            xytext=(0, 3),
-            textcoords="offset points",
-        )
+    ax.bar_label(bars, labels=_count_pct_labels(by_iso), padding=3, fontsize=9)
 
-    fig.tight_layout()
-    fig.savefig(outfile_png, dpi=FIG_DPI)
-    fig.savefig(outfile_pdf)
-    plt.close(fig)
+    _save_both(fig, outfile_png, outfile_pdf)
 
 
-def plot_bar_layers(by_layer: pd.DataFrame, outfile_png: Path, outfile_pdf: Path) -> None:
+def plot_bar_layers(by_layer: pd.DataFrame, outfile_png: Path, outfile_pdf: Path, fig: plt.Figure) -> None:
     """Bar chart: layers (counts) annotated with percentage."""
-    fig, ax = plt.subplots(figsize=(8, 4.5))
+    ax = _fresh_axes(fig, (8, 4.5))
     x = range(len(by_layer))
-    ax.bar(x, by_layer["count"].values, color=colors, edgecolor="#222222", linewidth=0.8)
+    bars = ax.bar(x, by_layer["count"].values, color=colors, edgecolor="#222222", linewidth=0.8)
     ax.set_xticks(x)
     ax.set_xticklabels(by_layer["layer"].astype(str), rotation=0, ha="center")
     ax.set_ylabel("Weighted count")
     ax.set_title("Distribution of Capabilities by Layer")
 
-    for idx, p in enumerate(ax.patches):
-        h = p.get_height()
-        if h <= 0:
-            continue
-        pct = by_layer.iloc[idx]["percent"]
-        ax.annotate(
-            f"{h:.1f} ({pct:.1f}%)",
-            (p.get_x() + p.get_width() / 2, h),
-            ha="center",
-            va="bottom",
-            fontsize=9,
-            xytext=(0, 3),
-            textcoords="offset points",
-        )
+    ax.bar_label(bars, labels=_count_pct_labels(by_layer), padding=3, fontsize=9)
 
-    fig.tight_layout()
-    fig.savefig(outfile_png, dpi=FIG_DPI)
-    fig.savefig(outfile_pdf)
-    plt.close(fig)
+    _save_both(fig, outfile_png, outfile_pdf)
 
 
-def plot_heatmap(heat_percent: pd.DataFrame, outfile_png: Path, outfile_pdf: Path) -> None:
+def plot_heatmap(heat_percent: pd.DataFrame, outfile_png: Path, outfile_pdf: Path, fig: plt.Figure) -> None:
     """
     Heatmap of ISO x Layer in percentage of total weight.
 
@@ -454,7 +587,7 @@ def plot_heatmap(heat_percent: pd.DataFrame, outfile_png: Path, outfile_pdf: Pat
                  "#777777", "#a0a0a0", "#c8c8c8", "#e0e0e0"]
     cmap = LinearSegmentedColormap.from_list("custom_heatmap", colors_hm, N=256)
 
-    fig, ax = plt.subplots(figsize=(9, 6))
+    ax = _fresh_axes(fig, (9, 6))
     im = ax.imshow(heat_percent.values, aspect="auto", cmap=cmap)
 
     ax.set_yticks(range(len(heat_percent.index)))
@@ -463,30 +596,25 @@ def plot_heatmap(heat_percent: pd.DataFrame, outfile_png: Path, outfile_pdf: Pat
     ax.set_xticklabels(heat_percent.columns.astype(str), rotation=0)
 
     vmax = float(heat_percent.values.max()) if heat_percent.size else 0.0
-    for i in range(heat_percent.shape[0]):
-        for j in range(heat_percent.shape[1]):
-            v = float(heat_percent.iat[i, j])
-            label = f"{v:.1f}%"
-            ax.text(
-                j,
-                i,
-                label,
-                ha="center",
-                va="center",
-                fontsize=15,
-                fontweight="bold",
-                color="black",
-                # color="white" if vmax and v > vmax * 0.6 else "black",
-            )
+    labels = np.char.add(np.char.mod("%.1f", heat_percent.to_numpy(dtype=float)), "%")
+    for (i, j), label in np.ndenumerate(labels):
+        ax.text(
+            j,
+            i,
+            label,
+            ha="center",
+            va="center",
+            fontsize=15,
+            fontweight="bold",
+            color="black",
+            # color="white" if vmax and v > vmax * 0.6 else "black",
+        )
 
     ax.set_title("Capabilities by ISO Class and Layer (percentage of total)")
     cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
     cbar.set_label("Percentage of total capability weight (%)")
 
-    fig.tight_layout()
-    fig.savefig(outfile_png, dpi=FIG_DPI)
-    fig.savefig(outfile_pdf)
-    plt.close(fig)
+    _save_both(fig, outfile_png, outfile_pdf)
 
 
 # -------------------------
@@ -518,22 +646,27 @@ def main() -> None:
     tables["heat_counts"].to_csv(OUT_DIR_TAB / "heatmap_iso_x_layer_counts.csv")
     tables["heat_percent"].to_csv(OUT_DIR_TAB / "heatmap_iso_x_layer_percent.csv")
 
-    # Plots
+    # Plots (one Figure, cleared and reused by each helper)
+    fig = plt.figure(layout="constrained")
     plot_bar_iso(
         tables["by_iso"],
         OUT_DIR_FIG / "bar_iso.png",
         OUT_DIR_FIG / "bar_iso.pdf",
+        fig,
     )
     plot_bar_layers(
         tables["by_layer"],
         OUT_DIR_FIG / "bar_layers.png",
         OUT_DIR_FIG / "bar_layers.pdf",
+        fig,
     )
     plot_heatmap(
         tables["heat_percent"],
         OUT_DIR_FIG / "heatmap_iso_x_layer.png",
-       OUT_DIR_FIG / "heatmap_iso_x_layer.pdf",
+        OUT_DIR_FIG / "heatmap_iso_x_layer.pdf",
+        fig,
     )
+    plt.close(fig)
 
     total_slots = len(long_df)
     missing_iso = long_df["iso"].isna().sum()
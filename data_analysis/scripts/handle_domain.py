@@ -28,16 +28,24 @@ Usage:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import argparse
+import csv
 import logging
 import re
+import sys
 import unicodedata
-from typing import Iterable, List, Dict, Tuple
+from typing import Iterable, List, Dict
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import matplotlib.pyplot as plt
 
+from csv_utils import read_csv_columns
+
 # =========================
 # Logging configuration
 # =========================
@@ -56,12 +64,29 @@ PALETTE = ["#3b5b92", "#6c8ebf", "#8aa8d6", "#b7c7ea",
 # =========================
 # Label normalization
 # =========================
+_WS_RE = re.compile(r"\s+")
+
+class _DiacriticTable(dict):
+    """
+    str.translate table dropping combining marks, filled lazily: a code
+    point is classified with `unicodedata.combining` on first lookup and
+    memoized (None deletes it, the code point itself keeps it).
+    """
+
+    def __missing__(self, cp: int):
+        value = None if unicodedata.combining(chr(cp)) else cp
+        self[cp] = value
+        return value
+
+
+_DIACRITIC_TABLE = _DiacriticTable()
+
+
 def _strip_accents(s: str) -> str:
     """Remove accents/diacritics from a string."""
-    return ''.join(
-        c for c in unicodedata.normalize('NFKD', s)
-        if not unicodedata.combining(c)
-    )
+    if s.isascii():
+        return s
+    return unicodedata.normalize('NFKD', s).translate(_DIACRITIC_TABLE)
 
 
 def _clean_token(tok: str) -> str:
@@ -71,11 +96,17 @@ def _clean_token(tok: str) -> str:
       - remove accents
       - normalize internal spaces
       - casefold (lowercase with unicode awareness)
+
+    Pure-ASCII tokens (the common case) skip the NFKD pass; for them
+    `lower()` is equivalent to `casefold()`. The result is interned, like
+    the CANON_MAP keys.
     """
     t = tok.strip()
+    if t.isascii():
+        return sys.intern(_WS_RE.sub(" ", t).lower())
     t = _strip_accents(t)
-    t = re.sub(r"\s+", " ", t)
-    return t.casefold()
+    t = _WS_RE.sub(" ", t)
+    return sys.intern(t.casefold())
 
 
 # Canonical map (keys must be casefolded / accent-free)
@@ -137,20 +168,22 @@ CANON_MAP: Dict[str, str] = {
     # Others
     "others": "Others",
 }
+# Interned keys: lookups with interned cleaned tokens match by identity
+CANON_MAP = {sys.intern(k): v for k, v in CANON_MAP.items()}
 
-# Auxiliary regex rules to capture broader real-time / streaming patterns
-_REGEX_RULES: List[Tuple[re.Pattern, str]] = [
-    # Anything that mentions 'real-time', 'real time', or 'rt'
-    (re.compile(r"\b(real[-\s]?time|rt)\b", re.I), "Data Streaming & Real-Time"),
-    # Anything that mentions 'stream' or 'streaming'
-    (re.compile(r"\bstream(ing)?\b", re.I), "Data Streaming & Real-Time"),
-]
+# Auxiliary regex rule to capture broader real-time / streaming patterns:
+# anything that mentions 'real-time', 'real time', 'rt', 'stream' or 'streaming'.
+# Tokens are casefolded before matching, so no re.I is needed.
+_STREAMING_RE = re.compile(r"\b(?:real[-\s]?time|rt|stream(?:ing)?)\b")
 
 
+@lru_cache(maxsize=4096)
 def normalize_domain_token(raw: str) -> str:
     """
     Normalize a single domain token to its canonical form.
 
+    The function is pure, so results are memoized per raw token.
+
     Steps:
       1) Clean token (strip, remove accents, normalize spaces, casefold).
       2) Apply regex rules for streaming/real-time.
@@ -162,10 +195,10 @@ def normalize_domain_token(raw: str) -> str:
     if not base:
         return ""
 
-    # 1) Regex rules (broad match for streaming / real-time)
-    for pat, label in _REGEX_RULES:
-        if pat.search(base):
-            return label
+    # 1) Regex rule (broad match for streaming / real-time); the substring
+    #    tests are necessary for a match and skip the regex for most tokens
+    if ("stream" in base or "real" in base or "rt" in base) and _STREAMING_RE.search(base):
+        return "Data Streaming & Real-Time"
 
     # 2) Canonical map
     if base in CANON_MAP:
@@ -178,7 +211,11 @@ def normalize_domain_token(raw: str) -> str:
         return "IIoT"
 
     # 4) Fallback: Title Case on the original raw token
-    return re.sub(r"\s+", " ", raw.strip()).title()
+    return _WS_RE.sub(" ", raw.strip()).title()
+
+
+# One comma-separated item per match, without its surrounding whitespace
+_TOKEN_RE = re.compile(r"\s*([^,]+?)\s*(?:,|$)")
 
 
 def split_domains(cell: str) -> List[str]:
@@ -186,11 +223,11 @@ def split_domains(cell: str) -> List[str]:
     Split a multi-valued domain cell by comma, preserving composite items.
     Returns a list of raw tokens.
     """
-    if pd.isna(cell):
+    if cell is None or cell is pd.NA or (isinstance(cell, float) and cell != cell):
         return []
     parts = [p.strip() for p in str(cell).split(",")]
-    # remove empty tokens
-    return [p for p in parts if p]
+    # remove empty tokens; interned so repeated tokens hit the cache by identity
+    return [sys.intern(p) for p in parts if p]
 
 
 def normalize_domains(tokens: Iterable[str]) -> List[str]:
@@ -205,6 +242,69 @@ def normalize_domains(tokens: Iterable[str]) -> List[str]:
     return out
 
 
+def domains_long(cells: pd.Series, ids: pd.Series, id_col_name: str) -> pd.DataFrame:
+    """
+    Column-wise equivalent of running `split_domains` + `normalize_domains`
+    on every cell and keeping the sorted, de-duplicated labels per row.
+
+    `normalize_domain_token` is called once per distinct raw token; rows are
+    emitted in input order with one row per (repo, normalized domain).
+    """
+    cells = pd.Series(cells.to_numpy(), index=np.arange(len(cells)))
+    # One regex pass splits on commas and trims the surrounding whitespace;
+    # the strip only matters for whitespace-only items, which are dropped.
+    tokens = cells[cells.notna()].astype(str).str.extractall(_TOKEN_RE)[0]
+    raw = pd.Series(
+        tokens.str.strip().to_numpy(), index=tokens.index.get_level_values(0)
+    )
+    raw = raw[raw.ne("")]
+
+    mapping = {r: normalize_domain_token(r) for r in raw.unique()}
+    labels = raw.map(mapping)
+    labels = labels[labels.ne("")]
+
+    long_df = pd.DataFrame(
+        {
+            id_col_name: ids.to_numpy()[labels.index.to_numpy(dtype=np.intp)],
+            "domain": labels.to_numpy(),
+            "_row": labels.index,
+        }
+    )
+    return (
+        long_df.drop_duplicates(subset=["_row", "domain"])
+        .sort_values(["_row", "domain"], kind="stable")
+        .drop(columns="_row")
+        .reset_index(drop=True)
+    )
+
+
+def write_text_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write a table of text columns with Arrow's CSV writer.
+
+    Output matches `df.to_csv(path, index=False)`: the header goes through
+    the stdlib csv writer and values are written unquoted. Tables with
+    float columns (whose text form differs between the writers), or with a
+    value that would need quoting, are written with pandas instead; so are
+    tables Arrow cannot convert (e.g. mixed-type object columns).
+    """
+    if any(pd.api.types.is_float_dtype(dt) for dt in df.dtypes):
+        df.to_csv(path, index=False)
+        return
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            csv.writer(fh, lineterminator="\n").writerow(df.columns)
+        with open(path, "ab") as fh:
+            pacsv.write_csv(
+                table,
+                fh,
+                write_options=pacsv.WriteOptions(include_header=False, quoting_style="none"),
+            )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df.to_csv(path, index=False)
+
+
 # =========================
 # Plot
 # =========================
@@ -220,7 +320,10 @@ def plot_bar_counts(
     If a 'percentage' column is present, the bar labels will show
     both count and percentage (e.g., "12 (17.4%)").
     """
-    df = counts_df.sort_values("count", ascending=False).copy()
+    # value_counts output is already in descending order; only sort otherwise
+    df = counts_df
+    if not df["count"].is_monotonic_decreasing:
+        df = df.sort_values("count", ascending=False)
     labels = df["domain"].tolist()
     values = df["count"].tolist()
 
@@ -233,33 +336,23 @@ def plot_bar_counts(
     # Colors: cycle through palette to ensure one color per bar
     colors = [PALETTE[i % len(PALETTE)] for i in range(len(values))]
 
-    plt.figure(figsize=(12, max(4, 0.35 * len(labels))))  # adaptive height
-    bars = plt.barh(labels, values, color=colors, edgecolor="black")
-    plt.xlabel("Number of Projects")
-    plt.title(title)
-    plt.gca().invert_yaxis()  # most frequent on top
+    fig, ax = plt.subplots(figsize=(12, max(4, 0.35 * len(labels))))  # adaptive height
+    bars = ax.barh(labels, values, color=colors, edgecolor="black")
+    ax.set_xlabel("Number of Projects")
+    ax.set_title(title)
+    ax.invert_yaxis()  # most frequent on top
 
     # Value labels on each bar
-    max_val = max(values) if values else 0
-    offset = max_val * 0.01 if max_val > 0 else 0.1
-
-    for bar, val, pct in zip(bars, values, pct_values):
-        if pct is not None:
-            label_text = f"{val} ({pct:.1f}%)"
-        else:
-            label_text = str(val)
-        plt.text(
-            val + offset,
-            bar.get_y() + bar.get_height() / 2,
-            label_text,
-            va="center",
-            fontsize=9,
-        )
+    label_texts = [
+        f"{val} ({pct:.1f}%)" if pct is not None else str(val)
+        for val, pct in zip(values, pct_values)
+    ]
+    ax.bar_label(bars, labels=label_texts, padding=3, fontsize=9)
 
-    plt.tight_layout()
-    plt.savefig(out_png, dpi=300)
-    plt.savefig(out_pdf)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(out_png, dpi=300)
+    fig.savefig(out_pdf)
+    plt.close(fig)
 
 
 # =========================
@@ -318,11 +411,14 @@ def main() -> None:
     args.out_tab_dir.mkdir(parents=True, exist_ok=True)
 
     log.info(f"Reading input CSV: {args.input}")
-    df = pd.read_csv(args.input)
-
-    if args.col not in df.columns:
+    header = pd.read_csv(args.input, nrows=0).columns
+    if args.col not in header:
         raise SystemExit(f"Column '{args.col}' not found in the CSV.")
 
+    # Only the domain (and ID) columns are parsed
+    usecols = [args.col] + [c for c in [args.idcol] if c and c in header and c != args.col]
+    df = read_csv_columns(args.input, usecols)
+
     # Determine project/repository ID
     if args.idcol and args.idcol in df.columns:
         id_series = df[args.idcol]
@@ -334,19 +430,15 @@ def main() -> None:
     total_repos = int(id_series.nunique())
     log.info("Total repositories (rows) in input: %d", total_repos)
 
-    # --- Normalize to long format
-    rows = []
-    for repo_id, cell in zip(id_series, df[args.col]):
-        raw_tokens = split_domains(cell)
-        norm_tokens = normalize_domains(raw_tokens)
-        # Remove duplicate domains per project
-        norm_tokens = sorted(set(norm_tokens))
-        for token in norm_tokens:
-            rows.append({id_col_name: repo_id, "domain": token})
-
-    long_df = pd.DataFrame(rows)
+    # --- Normalize to long format (duplicate domains per project removed)
+    long_df = domains_long(df[args.col], id_series, id_col_name)
+    # Few distinct labels: count on integer category codes. Categories keep
+    # first-appearance order so count ties rank as with the object dtype.
+    long_df["domain"] = pd.Categorical(
+        long_df["domain"], categories=pd.unique(long_df["domain"])
+    )
     long_path = args.out_tab_dir / "domains_normalized_long.csv"
-    long_df.to_csv(long_path, index=False)
+    write_text_csv(long_df, long_path)
     log.info("Saved normalized long-format table: %s", long_path)
 
     if long_df.empty:
@@ -30,17 +30,19 @@ Usage example:
         --output ../results/tables/codes_clean.csv
 
 Dependencies:
+    - numpy
     - pandas
-    - scikit-learn
 """
 
 import argparse
 import re
-from typing import List, Dict
+from itertools import chain
+from typing import Dict, Iterable, List
 
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MultiLabelBinarizer
-from sklearn.metrics import cohen_kappa_score
+
+from csv_utils import read_csv_columns
 
 
 # -------------------------------------------------------------------
@@ -71,7 +73,7 @@ def parse_labels(cell: str) -> List[str]:
     - Strips whitespace around labels.
     - Returns an empty list for empty/NaN cells.
     """
-    if pd.isna(cell):
+    if cell is None or cell is pd.NA or (isinstance(cell, float) and cell != cell):
         return []
 
     # Split on comma or semicolon
@@ -114,6 +116,45 @@ def normalize_labels(labels: List[str]) -> List[str]:
 # 2. Multi-label Cohen's Kappa computation
 # -------------------------------------------------------------------
 
+def binarize_labels(label_lists: Iterable[List[str]], label_to_col: Dict[str, int]) -> np.ndarray:
+    """
+    Build the (n_rows x n_labels) 0/1 indicator matrix for a column of
+    label lists, with columns ordered as in `label_to_col`.
+    """
+    label_lists = list(label_lists)
+    out = np.zeros((len(label_lists), len(label_to_col)), dtype=np.int8)
+    for i, lst in enumerate(label_lists):
+        for lab in lst:
+            out[i, label_to_col[lab]] = 1
+    return out
+
+
+def binary_kappa_per_label(r1_bin: np.ndarray, r2_bin: np.ndarray) -> np.ndarray:
+    """
+    Cohen's Kappa for every column of two (n_rows x n_labels) 0/1 matrices.
+
+    Each column is one binary coding decision, so Kappa reduces to its 2x2
+    confusion matrix; all labels are computed in one vectorized pass. The
+    arithmetic follows `sklearn.metrics.cohen_kappa_score`:
+
+        kappa = 1 - observed disagreement / expected disagreement
+
+    A label on which the two coders are constant and in agreement has no
+    expected disagreement; its Kappa is undefined and returned as NaN.
+    """
+    r1 = r1_bin.astype(bool)
+    r2 = r2_bin.astype(bool)
+    n = r1.shape[0]
+
+    observed = np.count_nonzero(r1 != r2, axis=0)
+    pos1 = np.count_nonzero(r1, axis=0)
+    pos2 = np.count_nonzero(r2, axis=0)
+    expected = (n - pos1) * pos2 / n + pos1 * (n - pos2) / n
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 1 - observed / expected
+
+
 def compute_multilabel_kappa(
     df: pd.DataFrame,
     col_r1: str = "R1",
@@ -129,7 +170,7 @@ def compute_multilabel_kappa(
     Steps:
       1) Parse and normalize labels for R1 and R2.
       2) Build a multi-label binarized representation
-         (one binary variable per attribute).
+         (one int8 binary variable per attribute).
       3) Compute Cohen's Kappa per attribute.
       4) Compute macro-Kappa as the unweighted mean
          across attributes.
@@ -149,11 +190,7 @@ def compute_multilabel_kappa(
 
     # Collect the set of all distinct labels present
     all_labels = sorted(
-        list(
-            set(
-                sum(df["R1_list"].tolist() + df["R2_list"].tolist(), [])
-            )
-        )
+        set(chain.from_iterable(chain(df["R1_list"], df["R2_list"])))
     )
 
     print("Distinct normalized labels found:")
@@ -161,16 +198,13 @@ def compute_multilabel_kappa(
         print(f"  - {lab}")
     print()
 
-    # Multi-label binarization
-    mlb = MultiLabelBinarizer(classes=all_labels)
-    r1_bin = mlb.fit_transform(df["R1_list"])
-    r2_bin = mlb.transform(df["R2_list"])
+    # Multi-label binarization (one int8 column per label)
+    label_to_col = {lab: i for i, lab in enumerate(all_labels)}
+    r1_bin = binarize_labels(df["R1_list"], label_to_col)
+    r2_bin = binarize_labels(df["R2_list"], label_to_col)
 
     # Per-label Cohen's Kappa
-    kappas = {}
-    for i, label in enumerate(all_labels):
-        k = cohen_kappa_score(r1_bin[:, i], r2_bin[:, i])
-        kappas[label] = k
+    kappas = dict(zip(all_labels, binary_kappa_per_label(r1_bin, r2_bin).tolist()))
 
     # Macro-Kappa = simple mean over all attributes
     macro_kappa = sum(kappas.values()) / len(kappas)
@@ -186,6 +220,11 @@ def compute_multilabel_kappa(
 # 3. Command-line interface
 # -------------------------------------------------------------------
 
+# Coder columns in the qualitative-requirements sheet
+COL_R1 = "QR_R1"
+COL_R2 = "QR_R2"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description=(
@@ -209,18 +248,23 @@ def main():
     )
     args = parser.parse_args()
 
-    # Read original CSV
-    df = pd.read_csv(args.input)
+    # Read only the coder columns
+    df = read_csv_columns(args.input, [COL_R1, COL_R2])
 
     # Compute and report Kappa
-    compute_multilabel_kappa(df, col_r1="QR_R1", col_r2="QR_R2")
+    compute_multilabel_kappa(df, col_r1=COL_R1, col_r2=COL_R2)
 
     # Optionally store normalized labels for transparency
     if args.output:
-        df["R1_normalized"] = df["R1_list"].apply(lambda lst: ", ".join(lst))
-        df["R2_normalized"] = df["R2_list"].apply(lambda lst: ", ".join(lst))
-
-        df.to_csv(args.output, index=False)
+        # The other columns are written back as pandas reads them, untouched
+        # by Arrow's type inference
+        sheet = pd.read_csv(args.input)
+        sheet["R1_list"] = df["R1_list"]
+        sheet["R2_list"] = df["R2_list"]
+        sheet["R1_normalized"] = df["R1_list"].apply(lambda lst: ", ".join(lst))
+        sheet["R2_normalized"] = df["R2_list"].apply(lambda lst: ", ".join(lst))
+
+        sheet.to_csv(args.output, index=False)
         print(f"\nNormalized spreadsheet saved to: {args.output}")
 
 
@@ -28,13 +28,18 @@ Autor: você :) — com uma ajudinha do seu co-piloto
 from __future__ import annotations
 
 import argparse
+import csv
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # só salva arquivos; dispensa backend de GUI
 import matplotlib.pyplot as plt
 
 
@@ -80,9 +85,14 @@ TEXT_ALIASES = {
     "very useful": "Very useful",
 }
 
+# Regexes compiladas uma única vez (usadas por célula / por rótulo)
+_SCORE_SUFFIX_RE = re.compile(r"\s*\(\d+\)\s*$")
+_GUIDELINE_RE = re.compile(r"\[\s*G\s*0*(\d+)", re.IGNORECASE)
+_GUIDELINE_ANY_RE = re.compile(r"\[\s*G\s*\d+", re.IGNORECASE)
+
 def _strip_score_suffix(s: str) -> str:
     # Remove sufixos do tipo " (4)" ao final
-    return re.sub(r"\s*\(\d+\)\s*$", "", s)
+    return _SCORE_SUFFIX_RE.sub("", s)
 
 def normalize_agree_text(x: object) -> Optional[str]:
     if x is None or (isinstance(x, float) and np.isnan(x)):
@@ -101,6 +111,23 @@ def normalize_usefulness_text(x: object) -> Optional[str]:
         s = "very not useful"
     return TEXT_ALIASES.get(s, None)
 
+# Igual a TEXT_ALIASES, mais a tolerância "verynotuseful" da escala useful
+USEFULNESS_ALIASES = {**TEXT_ALIASES, "verynotuseful": "Very not useful"}
+
+def _vector_clean_text(series: pd.Series) -> pd.Series:
+    # strip + lower + remove sufixo " (4)" numa passada por coluna
+    # (NaN/None viram "nan"/"None", que não casam com nenhum alias)
+    s = series.astype(str).str.strip().str.lower()
+    return s.str.replace(_SCORE_SUFFIX_RE, "", regex=True)
+
+def _vector_normalize_agree(series: pd.Series) -> pd.Series:
+    """Versão vetorizada de `normalize_agree_text` (não mapeados viram NaN)."""
+    return _vector_clean_text(series).map(TEXT_ALIASES)
+
+def _vector_normalize_usefulness(series: pd.Series) -> pd.Series:
+    """Versão vetorizada de `normalize_usefulness_text` (não mapeados viram NaN)."""
+    return _vector_clean_text(series).map(USEFULNESS_ALIASES)
+
 def numeric_to_5pt(x: object) -> Optional[str]:
     """Mapeia 1..5, 0..4 ou 1..7 para a escala 'Strongly disagree'..'Strongly agree' (genérica 5-pt)."""
     try:
@@ -141,102 +168,190 @@ def numeric_to_5pt(x: object) -> Optional[str]:
     return None
 
 
+# Tabela valor inteiro → nível, equivalente a `numeric_to_5pt`:
+# 1..5 idênticos; 0 (escala 0..4) e 6..7 (escala 1..7) colapsam nas bordas
+_NUM_5PT_LUT = np.array(
+    ["Strongly disagree", "Strongly disagree", "Disagree", "Neutral",
+     "Agree", "Strongly agree", "Strongly agree", "Strongly agree"],
+    dtype=object,
+)
+
+def _vector_numeric_to_5pt(series: pd.Series) -> pd.Series:
+    """Versão vetorizada de `numeric_to_5pt` (não mapeados viram NaN)."""
+    v = pd.to_numeric(series.astype(str).str.strip(), errors="coerce")
+    valid = v.isin(range(len(_NUM_5PT_LUT))).to_numpy()
+    out = np.full(len(v), np.nan, dtype=object)
+    out[valid] = _NUM_5PT_LUT[v.to_numpy()[valid].astype(np.intp)]
+    return pd.Series(out, index=series.index)
+
+
 # ---------------------------
 # Detecção de colunas Likert
 # ---------------------------
 
+# Acima disso a coluna é tratada como texto livre (escalas têm até 7 níveis,
+# com folga para variações de grafia como "Agree" / "agree (4)")
+MAX_LIKERT_DISTINCT = 20
+
+def _profile_column(series: pd.Series, consider_scales: List[str]) -> Optional[Dict]:
+    """Perfil Likert de uma coluna, ou None se ela não parece Likert."""
+    # Filtro barato antes de normalizar: datas nunca são Likert; com menos
+    # de 3 valores distintos não há os 3 níveis exigidos; e muitas respostas
+    # distintas indicam texto livre (e-mail, comentários…)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return None
+    n_unique = series.nunique(dropna=True)
+    if n_unique < 3 or n_unique > MAX_LIKERT_DISTINCT:
+        return None
+
+    # Normaliza só o vocabulário da coluna (k respostas distintas, não N
+    # linhas) e remapeia pelos códigos; NaN vira "nan", que não casa com nada
+    codes, uniques = pd.factorize(series.astype(str))
+    uniques = pd.Series(uniques)
+
+    def _on_uniques(normalize) -> pd.Series:
+        return pd.Series(normalize(uniques).to_numpy()[codes], index=series.index)
+
+    # Candidatos só das escalas pedidas, na ordem de desempate do max():
+    # usefulness, agree em texto, numérica → genérica agree 5-pt
+    normalizers = []
+    if "useful" in consider_scales:
+        normalizers.append(("useful", _vector_normalize_usefulness))
+    if "agree" in consider_scales:
+        normalizers += [("agree_txt", _vector_normalize_agree), ("agree_num", _vector_numeric_to_5pt)]
+
+    # escolhe a melhor cobertura; com cobertura total nenhum seguinte vence
+    n_valid = int(series.notna().sum())
+    mapped_by_key: Dict[str, pd.Series] = {}
+    key, mapped, best = None, None, -1
+    for cand_key, normalize in normalizers:
+        cand = mapped_by_key[cand_key] = _on_uniques(normalize)
+        hits = int(cand.notna().sum())
+        if hits > best:
+            key, mapped, best = cand_key, cand, hits
+        if best >= n_valid:
+            break
+    if mapped is None:
+        return None
+    non_null = mapped.dropna()
+
+    if non_null.empty:
+        return None
+
+    coverage = non_null.size / max(1, n_valid)
+    # precisa de diversidade mínima de níveis (>=3)
+    uniq = pd.unique(non_null.to_numpy())
+    if coverage >= 0.50 and uniq.size >= 3:
+        if key == "useful":
+            order = USEFULNESS_ORDER
+            scale = "useful"
+            counted = mapped
+        else:
+            order = AGREE_ORDER
+            scale = "agree"  # tanto txt quanto num viram agree
+            # mesma regra de build_tables: numérico, se vazio cai no texto
+            mapped_num = mapped_by_key.get("agree_num")
+            if mapped_num is None:
+                mapped_num = _on_uniques(_vector_numeric_to_5pt)
+            counted = mapped_num if mapped_num.notna().any() else mapped_by_key["agree_txt"]
+        uniq_set = set(uniq.tolist())
+        return {
+            "scale": scale,
+            "order": order,
+            "coverage": round(float(coverage), 3),
+            "valid": int(non_null.size),
+            "levels_observed": [lvl for lvl in order if lvl in uniq_set],
+            # reaproveitado em build_tables (evita remapear a coluna)
+            "mapped": pd.Categorical(counted, categories=order),
+        }
+    return None
+
+
 def detect_likert_columns(
     df: pd.DataFrame,
-    consider_scales: List[str]
+    consider_scales: List[str],
+    workers: Optional[int] = None,
 ) -> Dict[str, Dict]:
     """
     Retorna um dicionário col->perfil com as colunas que parecem Likert
     de acordo com as escalas indicadas em `consider_scales` (ex.: ["useful","agree"]).
+    As colunas são independentes e analisadas em paralelo por `workers`
+    threads (None = padrão do ThreadPoolExecutor; 1 = sequencial).
     """
-    profiles: Dict[str, Dict] = {}
-    for col in df.columns:
-        series = df[col]
-
-        # Tenta usefulness
-        mapped_use = series.map(normalize_usefulness_text) if "useful" in consider_scales else pd.Series([None]*len(series))
-        # Tenta agree
-        mapped_agree = series.map(normalize_agree_text) if "agree" in consider_scales else pd.Series([None]*len(series))
-        # Tenta numérica → genérica agree 5-pt
-        mapped_num = series.map(numeric_to_5pt) if "agree" in consider_scales else pd.Series([None]*len(series))
-
-        # escolhe a melhor cobertura
-        cand = max(
-            [("useful", mapped_use), ("agree_txt", mapped_agree), ("agree_num", mapped_num)],
-            key=lambda t: t[1].notna().sum()
-        )
-        key, mapped = cand
-        non_null = mapped.dropna()
-
-        if non_null.empty:
-            continue
-
-        coverage = non_null.size / max(1, series.notna().sum())
-        # precisa de diversidade mínima de níveis (>=3)
-        distinct = list(pd.Index(non_null.unique()))
-        if coverage >= 0.50 and len(set(distinct)) >= 3:
-            if key == "useful":
-                order = USEFULNESS_ORDER
-                scale = "useful"
-            else:
-                order = AGREE_ORDER
-                scale = "agree"  # tanto txt quanto num viram agree
-            profiles[col] = {
-                "scale": scale,
-                "order": order,
-                "coverage": round(float(coverage), 3),
-                "valid": int(non_null.size),
-                "levels_observed": [lvl for lvl in order if lvl in set(non_null.unique())]
-            }
-
-    return profiles
+    columns = list(df.columns)
+
+    def _one(col: str) -> Optional[Dict]:
+        return _profile_column(df[col], consider_scales)
+
+    if workers == 1 or len(columns) < 2:
+        results = [_one(col) for col in columns]
+    else:
+        # ex.map preserva a ordem das colunas
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_one, columns))
+
+    return {col: prof for col, prof in zip(columns, results) if prof is not None}
 
 
 # ---------------------------
 # Plot e tabelas
 # ---------------------------
 
-def build_tables(
-    df: pd.DataFrame,
-    profiles: Dict[str, Dict],
-) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    rows_counts = []
-    rows_pcts = []
-    for col, meta in profiles.items():
-        scale = meta["scale"]
-        order = meta["order"]
-
-        if scale == "useful":
-            mapped = df[col].map(normalize_usefulness_text)
+def _mapped_codes(df: pd.DataFrame, col: str, meta: Dict) -> np.ndarray:
+    """Códigos int8 da coluna na escala do perfil (-1 = fora da escala)."""
+    mapped = meta.get("mapped")
+    if mapped is None:
+        if meta["scale"] == "useful":
+            mapped = _vector_normalize_usefulness(df[col])
         else:
             # "agree": tenta numérico, se vazio cai no texto
-            mapped = df[col].map(numeric_to_5pt)
+            mapped = _vector_numeric_to_5pt(df[col])
             if mapped.dropna().empty:
-                mapped = df[col].map(normalize_agree_text)
-
-        counts = mapped.value_counts().reindex(order, fill_value=0)
-        total = counts.sum()
-        pcts = (counts / total * 100.0).round(1) if total else counts.astype(float)
+                mapped = _vector_normalize_agree(df[col])
+        mapped = pd.Categorical(mapped, categories=meta["order"])
+    return mapped.codes
 
-        rows_counts.append({"question": col, **counts.to_dict()})
-        rows_pcts.append({"question": col, **pcts.to_dict()})
+def build_tables(
+    df: pd.DataFrame,
+    profiles: Dict[str, Dict],
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    if not profiles:
+        empty = pd.DataFrame(columns=["question"]).set_index("question")
+        return empty, empty.copy()
 
-    counts_df = (
-        pd.DataFrame(rows_counts).set_index("question")
-        if rows_counts else
-        pd.DataFrame(columns=["question"]).set_index("question")
-    )
-    pcts_df = (
-        pd.DataFrame(rows_pcts).set_index("question")
-        if rows_pcts else
-        pd.DataFrame(columns=["question"]).set_index("question")
-    )
+    # Agrupa as perguntas por escala: cada grupo vira uma matriz C x N de códigos
+    groups: Dict[Tuple[str, ...], List[str]] = {}
+    for col, meta in profiles.items():
+        groups.setdefault(tuple(meta["order"]), []).append(col)
+
+    count_frames = []
+    pct_frames = []
+    for order, cols in groups.items():
+        k = len(order)
+        codes_2d = np.stack([_mapped_codes(df, c, profiles[c]) for c in cols])
+        # Um único bincount: desloca os códigos de cada linha em k posições
+        valid = codes_2d >= 0
+        offsets = np.arange(len(cols))[:, None] * k
+        counts_2d = np.bincount(
+            (codes_2d + offsets)[valid], minlength=len(cols) * k
+        ).reshape(len(cols), k)
+
+        total = counts_2d.sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pcts_2d = np.where(total > 0, counts_2d / total * 100.0, counts_2d.astype(float))
+
+        count_frames.append(pd.DataFrame(counts_2d, index=cols, columns=list(order)))
+        pct_frames.append(pd.DataFrame(pcts_2d, index=cols, columns=list(order)).round(1))
+
+    # Mesma ordem de linhas/colunas (níveis na ordem de primeira aparição);
+    # níveis de outra escala ficam NaN
+    questions = list(profiles)
+    levels = list(dict.fromkeys(lvl for meta in profiles.values() for lvl in meta["order"]))
+    counts_df = pd.concat(count_frames).reindex(index=questions, columns=levels).rename_axis("question")
+    pcts_df = pd.concat(pct_frames).reindex(index=questions, columns=levels).rename_axis("question")
     return counts_df, pcts_df
 
+@lru_cache(maxsize=4096)
 def shorten_label(label: str) -> str:
     """
     Extrai apenas o ID da guideline no formato [Gxx] e descarta todo o texto.
@@ -245,7 +360,7 @@ def shorten_label(label: str) -> str:
         "[ G 7 ] texto"        → "[G07]"
     """
     # Captura padrões [G15], [G 15], [G15 - ...], etc.
-    m = re.search(r"\[\s*G\s*0*(\d+)", label, flags=re.IGNORECASE)
+    m = _GUIDELINE_RE.search(label)
     if m:
         gid = m.group(1).zfill(2)
         return f"[G{gid}]"
@@ -283,11 +398,14 @@ def plot_stacked_likert(
     title: str = "Likert overview (partial survey)",
     counts_df: Optional[pd.DataFrame] = None,
     figsize_base: float = 0.42,
+    fig: Optional[plt.Figure] = None,
 ) -> None:
     """
     Gera gráfico de barras horizontais empilhadas.
     Agora adiciona, em cada segmento colorido, o quantitativo (contagem) correspondente,
     se counts_df for fornecido.
+    Se `fig` for passado, a figura é limpa e reaproveitada (e não é fechada),
+    evitando recriar Figure/Canvas a cada chamada em lote.
     """
     if pcts_df.empty:
         log.warning("Nada a plotar: dataframe de percentuais vazio.")
@@ -295,29 +413,34 @@ def plot_stacked_likert(
 
     # Reordena linhas: agrupa por escala e mantém ordem de colunas da respectiva escala
     # Também permite filtrar para apenas perguntas com “[G…]” se solicitado
-    questions = list(pcts_df.index)
     if only_guidelines_flag:
-        questions = [q for q in questions if re.search(r"\[\s*G\s*\d+", q, flags=re.IGNORECASE)]
-        if not questions:
+        is_guideline = pcts_df.index.str.contains(_GUIDELINE_ANY_RE, na=False)
+        if not is_guideline.any():
             log.warning("Flag --only-guidelines ativa, mas nenhuma pergunta com '[G..]' foi encontrada.")
             return
-        pcts_df = pcts_df.loc[questions]
+        pcts_df = pcts_df[is_guideline]
         if counts_df is not None:
-            counts_df = counts_df.loc[questions]
+            counts_df = counts_df.loc[pcts_df.index]
 
     # Para plotar, garantimos que as colunas estejam em ordem consistente por linha (escala)
-    agree_rows = [q for q in pcts_df.index if profiles[q]["scale"] == "agree"]
-    usef_rows = [q for q in pcts_df.index if profiles[q]["scale"] == "useful"]
-
-    parts = []
-    if agree_rows:
-        part_agree = pcts_df.loc[agree_rows, AGREE_ORDER]
-        parts.append(part_agree)
-    if usef_rows:
-        part_usef = pcts_df.loc[usef_rows, USEFULNESS_ORDER]
-        parts.append(part_usef)
-
-    plot_df = pd.concat(parts, axis=0) if parts else pcts_df
+    # (uma passada pelas escalas → máscaras; linhas agree antes das useful)
+    scales = np.fromiter((profiles[q]["scale"] for q in pcts_df.index), dtype="U6", count=len(pcts_df))
+    is_agree = scales == "agree"
+    is_usef = scales == "useful"
+    rows = np.r_[np.flatnonzero(is_agree), np.flatnonzero(is_usef)]
+
+    if rows.size:
+        cols = list(dict.fromkeys(
+            (AGREE_ORDER if is_agree.any() else []) + (USEFULNESS_ORDER if is_usef.any() else [])
+        ))
+        plot_df = pcts_df.iloc[rows].reindex(columns=cols)
+        # níveis da outra escala ficam vazios na linha
+        col_agree = np.isin(cols, AGREE_ORDER)
+        col_usef = np.isin(cols, USEFULNESS_ORDER)
+        other = np.where(is_agree[rows, None], ~col_agree, ~col_usef)
+        plot_df = plot_df.mask(other)
+    else:
+        plot_df = pcts_df
 
     # Ajusta também counts_df para ter a mesma ordem de linhas
     if counts_df is not None:
@@ -326,45 +449,53 @@ def plot_stacked_likert(
     # Labels no eixo Y
     y_labels = [shorten_label(q) if shorten_labels_flag else q for q in plot_df.index]
 
-    plt.figure(figsize=(10, max(3, figsize_base * len(plot_df))))
+    figsize = (10, max(3, figsize_base * len(plot_df)))
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+    ax = fig.add_subplot(111)
     y_pos = np.arange(len(plot_df))
 
-    left = np.zeros(len(plot_df))
-    for level in plot_df.columns:
-        vals = plot_df[level].values
+    # Início (left) de cada segmento = soma acumulada dos níveis anteriores
+    vals_2d = plot_df.to_numpy(dtype=float)
+    lefts_2d = np.zeros_like(vals_2d)
+    lefts_2d[:, 1:] = np.cumsum(vals_2d, axis=1)[:, :-1]
 
-        # barra empilhada para esse nível
-        bars = plt.barh(y_pos, vals, left=left, label=level)
+    # barra empilhada para cada nível
+    for j, level in enumerate(plot_df.columns):
+        ax.barh(y_pos, vals_2d[:, j], left=lefts_2d[:, j], label=level,
+                linewidth=0, edgecolor="none")
 
-        # recupera contagens para esse nível (mesma ordem das linhas)
-        if counts_df is not None and level in counts_df.columns:
-            counts_vals = counts_df[level].values
-        else:
-            counts_vals = [None] * len(vals)
-
-        # adiciona texto no centro de cada segmento com o quantitativo
-        for bar, val, cnt in zip(bars, vals, counts_vals):
-            if val <= 0:
-                continue
-            if cnt is None or cnt == 0:
-                continue
-            x = bar.get_x() + bar.get_width() / 2.0
-            y = bar.get_y() + bar.get_height() / 2.0
-            plt.text(x, y, str(int(cnt)), ha="center", va="center", fontsize=8)
-
-        left = left + vals
-
-    plt.yticks(y_pos, y_labels)
-    plt.xlabel("Percentage of responses (%)")
-    plt.title(title)
+    # adiciona texto no centro de cada segmento com o quantitativo,
+    # lendo posições direto dos arrays (sem bar.get_x()/get_y())
+    if counts_df is not None:
+        # níveis ausentes em counts_df contam como 0 (sem rótulo)
+        counts_2d = counts_df.reindex(columns=plot_df.columns, fill_value=0).to_numpy(dtype=float)
+        centers_2d = lefts_2d + vals_2d / 2.0
+        show = ~(vals_2d <= 0) & (counts_2d != 0)
+        for j, i in zip(*np.nonzero(show.T)):
+            ax.text(centers_2d[i, j], y_pos[i], str(int(counts_2d[i, j])),
+                    ha="center", va="center", fontsize=8)
+
+    ax.set_yticks(y_pos, y_labels)
+    ax.set_xlabel("Percentage of responses (%)")
+    ax.set_title(title)
     # Legenda fora, canto superior direito
-    plt.legend(loc="lower right", bbox_to_anchor=(1.0, 1.02))
-    plt.tight_layout()
+    ax.legend(loc="lower right", bbox_to_anchor=(1.0, 1.02))
+    fig.tight_layout()
     out_png.parent.mkdir(parents=True, exist_ok=True)
     out_pdf.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(out_png, dpi=300, bbox_inches="tight")
-    plt.savefig(out_pdf, bbox_inches="tight")
-    plt.close()
+    # Caixa "tight" calculada uma vez (no dpi do PNG) e reaproveitada nos dois formatos
+    fig.set_dpi(300)
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(plt.rcParams["savefig.pad_inches"])
+    fig.savefig(out_png, dpi=300, bbox_inches=bbox)
+    fig.savefig(out_pdf, bbox_inches=bbox)
+    if owns_fig:
+        plt.close(fig)
 
 
 # ---------------------------
@@ -375,6 +506,18 @@ def load_csv_robust(path: Path) -> pd.DataFrame:
     """
     Tenta carregar o CSV do Google Forms de forma robusta.
     """
+    # Caminho rápido: infere o delimitador uma vez (na 1ª linha, como o
+    # sep=None do pandas) e lê com o parser multithread do Arrow
+    try:
+        with open(path, newline="", encoding="utf-8") as fh:
+            delim = csv.Sniffer().sniff(fh.readline()).delimiter
+        df = pd.read_csv(path, sep=delim, engine="pyarrow", dtype_backend="pyarrow")
+        # o Arrow não renomeia cabeçalhos repetidos ("x", "x.1"); nesse caso
+        # deixa para o engine='python'
+        if df.columns.is_unique:
+            return df
+    except Exception as e:
+        log.warning(f"Leitura com engine='pyarrow' falhou ({e}), tentando sep=None…")
     # engine='python' com sep=None tenta inferir delimitador
     try:
         df = pd.read_csv(path, engine="python", sep=None)
@@ -446,7 +589,8 @@ def main():
     if args.shorten_labels:
         mapping = pd.DataFrame({
             "question": pcts_df.index,
-            "alias": [shorten_label(q) for q in pcts_df.index]
+            # mesmos rótulos do eixo Y, já em cache via lru_cache
+            "alias": pcts_df.index.map(shorten_label)
         })
         map_path = args.out_tables / f"{args.basename}_label_map.csv"
         mapping.to_csv(map_path, index=False, encoding="utf-8")
@@ -1,14 +1,24 @@
 import requests
 import csv
+import json
 import os
+import sqlite3
 import time
+import random
 import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
 
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 
 from utils import format_datetime
 
@@ -18,21 +28,396 @@ load_dotenv()
 root = os.getcwd()
 logger = logging.getLogger(__name__)
 
+# Repository metrics from previous runs, keyed by (full_name, pushed_at)
+METRICS_CACHE_PATH = os.path.join(root, "dataset", "metrics_cache.db")
+
 
 last_year_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
 
-NUM_COMMITS = 50
 NUM_STARS = 2
 
-PER_PAGE = int(os.getenv('PER_PAGE'))
-MAX_RESP = int(os.getenv('MAX_RESP'))
+# GitHub's maximum page size; smaller pages only multiply the request count
+MAX_PER_PAGE = 100
+
+# Metric requests in flight at once (the work is latency-bound, so threads suffice)
+METRIC_WORKERS = 16
+
+# Search terms mined at once; kept low because the search API only allows
+# 30 requests per minute
+TERM_WORKERS = 2
 
-TOKEN    = os.getenv('API_TOKEN')
+# Upper bound, in seconds, for one jittered backoff sleep in `github_get`
+MAX_BACKOFF = 60.0
+
+# Below this many requests left in a rate-limit window, `github_get` spreads
+# the remaining budget over the time left until the window resets
+RATE_LIMIT_FLOOR = 50
+
+# Commit window counted in the `commits_2024` column
+COMMITS_2024_PARAMS = {
+    "since": "2024-01-01T00:00:00Z",
+    "until": "2024-12-31T23:59:59Z",
+}
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+# Repositories aliased into a single GraphQL query
+GRAPHQL_BATCH = 20
+
+# Per-repository fragment: total and 2024 commit counts of the default branch
+GRAPHQL_REPO_FRAGMENT = """
+  r{index}: repository(owner: {owner}, name: {name}) {{
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          total: history {{ totalCount }}
+          y2024: history(since: "2024-01-01T00:00:00Z", until: "2024-12-31T23:59:59Z") {{ totalCount }}
+        }}
+      }}
+    }}
+  }}"""
+
+PER_PAGE = int(os.getenv('PER_PAGE', str(MAX_PER_PAGE)))
+MAX_RESP = int(os.getenv('MAX_RESP', '400'))
+
+# `.env.example` names the token GITHUB_API_TOKEN; API_TOKEN is still read
+# so existing `.env` files keep working
+TOKEN    = os.getenv('GITHUB_API_TOKEN') or os.getenv('API_TOKEN')
 
 headers = {
-    'Authorization': f'token {TOKEN}',
     'Accept': 'application/vnd.github.v3+json'
 }
+if TOKEN:
+    headers['Authorization'] = f'token {TOKEN}'
+
+# One pooled keep-alive session for every API call, so only the first
+# request per connection pays the TCP/TLS handshake. Transient 5xx answers
+# are retried by urllib3 (honoring Retry-After); the last response is still
+# returned so callers can log its status. Rate-limit answers (403/429) are
+# handled by `github_get`.
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            status_forcelist=[500, 502, 503, 504],
+            backoff_factor=1,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+# Last `X-RateLimit-Remaining` / `X-RateLimit-Reset` seen per resource
+# ("core", "search", ...), shared by every worker thread. `_pace` decrements
+# the remaining count for each request it lets through, so requests still in
+# flight are accounted for before their response headers arrive.
+_rate_state: Dict[str, Tuple[int, float]] = {}
+# Earliest time the next paced request of each resource may be sent
+_next_send: Dict[str, float] = {}
+_rate_lock = threading.Lock()
+
+
+def _rate_resource(url: str) -> str:
+    """Return the GitHub rate-limit resource an endpoint is counted against."""
+    return "search" if urlparse(url).path.startswith("/search/") else "core"
+
+
+def _pace(resource: str) -> None:
+    """
+    Reserve one request of `resource`'s budget, sleeping first when it is close
+    to exhausted.
+
+    Below `RATE_LIMIT_FLOOR`, the time left until the window resets is split
+    evenly over the remaining requests; once none is left, callers wait for
+    the reset. Each caller claims the next free send slot under the lock, so
+    concurrent workers are spaced out instead of sleeping the same amount and
+    sending together.
+    """
+    with _rate_lock:
+        state = _rate_state.get(resource)
+        if state is None:
+            return
+        remaining, reset = state
+        _rate_state[resource] = (remaining - 1, reset)
+        if remaining >= RATE_LIMIT_FLOOR:
+            return
+        now = time.time()
+        if remaining > 0:
+            start = max(now, _next_send.get(resource, now))
+            send_at = start + max(0.0, reset - start) / remaining
+        else:
+            # Budget already reserved by other callers: wait for the reset
+            send_at = max(now, reset)
+        _next_send[resource] = send_at
+    wait = send_at - now
+    if wait > 0:
+        logger.info(
+            "%d %s requests left; pausing %.1fs before the next one.",
+            remaining,
+            resource,
+            wait,
+        )
+        time.sleep(wait)
+
+
+def _record_rate(resource: str, response: requests.Response) -> None:
+    """Remember the rate-limit headers of the last response for `resource`."""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return
+    resource = response.headers.get("X-RateLimit-Resource", resource)
+    with _rate_lock:
+        _rate_state[resource] = (int(remaining), float(reset))
+
+
+def github_get(
+    url: str,
+    params: Optional[Dict] = None,
+    timeout: float = 10,
+    max_attempts: int = 5,
+    backoff_base: float = 1.0,
+) -> requests.Response:
+    """
+    Issue a GET request to the GitHub API through the shared session.
+
+    Rate-limited answers are retried: a `Retry-After` header is honored
+    first; a 403 waits for `X-RateLimit-Reset` only when the primary limit is
+    really exhausted (`X-RateLimit-Remaining: 0`); a bare 429 backs off with
+    decorrelated jitter so parallel workers do not retry in lockstep. Other
+    403s (permissions, oversized contributor lists) are returned at once.
+
+    Requests are not throttled while the rate-limit budget is healthy; once
+    fewer than `RATE_LIMIT_FLOOR` calls remain, each request waits its share
+    of the time left until `X-RateLimit-Reset`.
+
+    Parameters
+    ----------
+    url : str
+        Endpoint URL.
+    params : dict, optional
+        Query parameters.
+    timeout : float, optional
+        Request timeout in seconds. Default is 10.
+    max_attempts : int, optional
+        Maximum number of attempts. Default is 5.
+    backoff_base : float, optional
+        Minimum jittered backoff in seconds. Default is 1.0.
+
+    Returns
+    -------
+    requests.Response
+        The last API response.
+    """
+    delay = backoff_base
+    resource = _rate_resource(url)
+    for attempt in range(1, max_attempts + 1):
+        _pace(resource)
+        response = SESSION.get(url, params=params, timeout=timeout)
+        _record_rate(resource, response)
+        if response.status_code not in (403, 429) or attempt == max_attempts:
+            return response
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            wait = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset", time.time()))
+            wait = max(0.0, reset - time.time()) + 1
+        elif response.status_code == 429:
+            delay = min(MAX_BACKOFF, random.uniform(backoff_base, delay * 3))
+            wait = delay
+        else:
+            return response
+
+        logger.warning(
+            "Rate limited on %s (%s); retrying in %.1fs (attempt %d/%d).",
+            url,
+            response.status_code,
+            wait,
+            attempt,
+            max_attempts,
+        )
+        time.sleep(wait)
+    return response
+
+
+# Search payload fields written to the CSV (the API returns ~4 KB per repo,
+# mostly URLs and owner details that are never used)
+REPO_FIELDS = (
+    "name",
+    "full_name",
+    "html_url",
+    "description",
+    "pushed_at",
+    "stargazers_count",
+    "fork",
+    "forks",
+    "language",
+    "size",
+    "score",
+    "is_template",
+    "archived",
+    "disabled",
+    "contributors_url",
+    "collaborators_url",
+)
+
+
+def project_repo(repo: Dict) -> Dict:
+    """
+    Keep only the fields the miner uses from a Search API repository object.
+
+    Parameters
+    ----------
+    repo : dict
+        Repository object as returned by the GitHub Search API.
+
+    Returns
+    -------
+    dict
+        The `REPO_FIELDS` values plus `owner` (the owner's login).
+    """
+    record = {field: repo[field] for field in REPO_FIELDS}
+    record["owner"] = repo["owner"]["login"]
+    return record
+
+
+class MetricsCache:
+    """
+    SQLite cache of repository metrics keyed by `(full_name, pushed_at)`.
+
+    A new push changes `pushed_at`, so stale entries are never returned;
+    they are replaced the next time the repository's metrics are stored.
+    The connection is shared by the term workers and guarded by a lock.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open (or create) the cache database.
+
+        Parameters
+        ----------
+        path : str
+            Path to the SQLite database file.
+        """
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            " full_name TEXT, pushed_at TEXT,"
+            " total_commits INTEGER, commits_2024 INTEGER, collaborators INTEGER,"
+            " PRIMARY KEY (full_name, pushed_at))"
+        )
+
+    def get_many(self, repos: List[Dict]) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Look up cached metrics.
+
+        Parameters
+        ----------
+        repos : list of dict
+            Repository records (need `full_name` and `pushed_at`).
+
+        Returns
+        -------
+        dict
+            `full_name -> (total_commits, commits_2024, collaborators)` for the
+            repositories found in the cache.
+        """
+        hits: Dict[str, Tuple[int, int, int]] = {}
+        with self.lock:
+            for repo in repos:
+                row = self.conn.execute(
+                    "SELECT total_commits, commits_2024, collaborators FROM metrics"
+                    " WHERE full_name = ? AND pushed_at = ?",
+                    (repo["full_name"], repo["pushed_at"]),
+                ).fetchone()
+                if row is not None:
+                    hits[repo["full_name"]] = row
+        return hits
+
+    def put_many(self, items: Iterable[Tuple[Dict, Tuple[int, int, int]]]) -> None:
+        """
+        Store metrics, dropping older snapshots of the same repositories.
+
+        Parameters
+        ----------
+        items : iterable of tuple
+            `(repo, (total_commits, commits_2024, collaborators))` pairs.
+        """
+        rows = [(repo["full_name"], repo["pushed_at"], *values) for repo, values in items]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "DELETE FROM metrics WHERE full_name = ? AND pushed_at != ?",
+                [row[:2] for row in rows],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+
+_metrics_cache: Optional[MetricsCache] = None
+_metrics_cache_lock = threading.Lock()
+
+
+def metrics_cache() -> MetricsCache:
+    """Return the shared `MetricsCache`, opening it at `METRICS_CACHE_PATH` on first use."""
+    global _metrics_cache
+    with _metrics_cache_lock:
+        if _metrics_cache is None:
+            os.makedirs(os.path.dirname(METRICS_CACHE_PATH), exist_ok=True)
+            _metrics_cache = MetricsCache(METRICS_CACHE_PATH)
+    return _metrics_cache
+
+
+def fetch_repo_metrics(repos: List[Dict]) -> List[Tuple[Optional[int], Optional[int], Optional[int]]]:
+    """
+    Fetch commit and collaborator metrics for repositories concurrently.
+
+    Commit counts come from batched GraphQL queries when a token is set;
+    repositories it could not resolve fall back to REST. Each remaining
+    (repository, metric) request runs on a thread pool bounded by
+    `METRIC_WORKERS`, so the per-repo request chains overlap.
+
+    Parameters
+    ----------
+    repos : list of dict
+        Repository records, as returned by `search_github_repos`.
+
+    Returns
+    -------
+    list of tuple
+        `(total_commits, commits_2024, collaborators)` per repository, in the
+        same order as `repos`; a failed request yields None.
+    """
+    commit_counts = graphql_commit_counts(repos) if TOKEN and repos else {}
+
+    with ThreadPoolExecutor(max_workers=METRIC_WORKERS) as executor:
+        futures = []
+        for repo in repos:
+            owner, name = repo["owner"], repo["name"]
+            repo_futures = []
+            if repo["full_name"] not in commit_counts:
+                repo_futures.append(executor.submit(_count_commits_range, owner, name, "commits"))
+                repo_futures.append(
+                    executor.submit(
+                        _count_commits_range, owner, name, "2024 commits", COMMITS_2024_PARAMS
+                    )
+                )
+            repo_futures.append(executor.submit(_count_collaborators, owner, name))
+            futures.append(repo_futures)
+
+        metrics = []
+        for repo, repo_futures in zip(repos, futures):
+            values = [f.result() for f in repo_futures]
+            metrics.append((*commit_counts.get(repo["full_name"], ()), *values))
+        return metrics
 
 
 class HandleCsv:
@@ -40,22 +425,27 @@ class HandleCsv:
     Helper class to handle CSV generation for mined GitHub repositories.
     """
 
-    def __init__(self, repos, term: str, prefix: str = "") -> None:
+    def __init__(self, repos, term: str, prefix: str = "", timestamp: Optional[str] = None) -> None:
         """
         Initialize the CSV handler.
 
         Parameters
         ----------
         repos : list
-            List of repository objects (as returned by the GitHub Search API).
+            List of repository records, as returned by `search_github_repos`
+            (see `project_repo`).
         term : str
             Search term used to retrieve the repositories.
         prefix : str, optional
             Prefix to be added to the output CSV filename.
+        timestamp : str, optional
+            Timestamp for the output CSV filename. If None, the current one
+            is taken when the file is saved.
         """
         self.term = term
         self.csv_file = repos
         self.prefix = prefix
+        self.timestamp = timestamp
         self.repos = repos
         self.output_path: Optional[str] = None
 
@@ -63,11 +453,10 @@ class HandleCsv:
         """
         Prepare output filename and trigger CSV export for the current repositories.
         """
-        filename = f"{self.prefix}{self.term}_repos_{format_datetime()}.csv"
+        filename = f"{self.prefix}{self.term}_repos_{self.timestamp or format_datetime()}.csv"
         output_folder = os.path.join(root, "dataset/raw_data")
 
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
+        os.makedirs(output_folder, exist_ok=True)
 
         self.output_path = os.path.join(output_folder, filename)
 
@@ -75,6 +464,39 @@ class HandleCsv:
         self.save_to_csv()
         logger.info("Data successfully saved to %s", self.output_path)
 
+    def gather_metrics(self) -> List[Tuple[int, int, int]]:
+        """
+        Return commit and collaborator metrics for all repositories.
+
+        Repositories unchanged since a previous run (same `full_name` and
+        `pushed_at`) are served from the on-disk `MetricsCache`; the rest are
+        fetched concurrently by `fetch_repo_metrics` and cached when every
+        request succeeded.
+
+        Returns
+        -------
+        list of tuple
+            `(total_commits, commits_2024, collaborators)` per repository, in
+            the same order as `self.repos`. Failed requests count as 0.
+        """
+        cache = metrics_cache()
+        cached = cache.get_many(self.repos)
+        missing = [repo for repo in self.repos if repo["full_name"] not in cached]
+        logger.info(
+            "Metrics cache: %d hit(s), %d repositories to fetch.", len(cached), len(missing)
+        )
+
+        fetched = fetch_repo_metrics(missing)
+        cache.put_many(
+            (repo, values) for repo, values in zip(missing, fetched) if None not in values
+        )
+
+        fresh = {
+            repo["full_name"]: tuple(0 if v is None else v for v in values)
+            for repo, values in zip(missing, fetched)
+        }
+        return [cached.get(repo["full_name"]) or fresh[repo["full_name"]] for repo in self.repos]
+
     def save_to_csv(self) -> None:
         """
         Save repositories data to a CSV file, including commits and collaborators information.
@@ -83,6 +505,8 @@ class HandleCsv:
         -----
         - Uses `self.repos` as the source of data.
         - Requires `self.output_path` to be set before calling this method.
+        - Metrics are gathered and rows built before the file is opened, so it
+          is written with a single `writerows` call.
         """
         if not self.repos:
             logger.warning("No repository data to save. CSV file will not be created.")
@@ -92,6 +516,34 @@ class HandleCsv:
             logger.error("Output path is not set. Aborting CSV save operation.")
             return
 
+        metrics = self.gather_metrics()
+
+        rows = [
+            [
+                repo["name"],
+                repo["full_name"],
+                repo["html_url"],
+                repo["description"],
+                total_commits,
+                repo["pushed_at"],
+                commits_2024,
+                repo["stargazers_count"],
+                repo["fork"],
+                repo["forks"],
+                repo["language"],
+                repo["size"],
+                repo["score"],
+                repo["is_template"],
+                repo["archived"],
+                repo["disabled"],
+                repo["contributors_url"],
+                repo["collaborators_url"],
+                collaborators_count,
+                self.term,
+            ]
+            for repo, (total_commits, commits_2024, collaborators_count) in zip(self.repos, metrics)
+        ]
+
         with open(self.output_path, mode="w", newline="", encoding="utf-8") as file:
             writer = csv.writer(file)
             writer.writerow(
@@ -118,48 +570,7 @@ class HandleCsv:
                     "search_term",
                 ]
             )
-
-            for repo in self.repos:
-                owner = repo["owner"]["login"]
-                name = repo["name"]
-                full_name = repo["full_name"]
-                total_commits = count_total_commits(owner, name)
-                last_commit = repo["pushed_at"]
-                commits_2024 = count_commits_2024(owner, name)
-                fork = repo["fork"]
-                forks = repo["forks"]
-                size = repo["size"]
-                score = repo["score"]
-                archived = repo["archived"]
-                disabled = repo["disabled"]
-                contributors_url = repo["contributors_url"]
-                collaborators_url = repo["collaborators_url"]
-                collaborators_count = get_collaborators_count(owner, name)
-
-                writer.writerow(
-                    [
-                        name,
-                        full_name,
-                        repo["html_url"],
-                        repo["description"],
-                        total_commits,
-                        last_commit,
-                        commits_2024,
-                        repo["stargazers_count"],
-                        fork,
-                        forks,
-                        repo["language"],
-                        size,
-                        score,
-                        repo["is_template"],
-                        archived,
-                        disabled,
-                        contributors_url,
-                        collaborators_url,
-                        collaborators_count,
-                        self.term,
-                    ]
-                )
+            writer.writerows(rows)
 
     def load_repos_from_csv(self, file_path: str) -> List[Dict]:
         """
@@ -207,14 +618,18 @@ def search_github_repos(
     order : str, optional
         Sorting order: 'asc' for ascending, 'desc' for descending. Default is 'desc'.
     per_page : int, optional
-        Number of results per page (max: 100). Default is `PER_PAGE`.
+        Number of results per page (max: `MAX_PER_PAGE`). Default is `PER_PAGE`.
 
     Returns
     -------
     list of dict or None
-        List of repository objects (at most `MAX_RESP`), or None in case of error.
+        List of projected repository records (at most `MAX_RESP`), or None in
+        case of error. Only the fields listed in `REPO_FIELDS` are kept.
     """
     url = "https://api.github.com/search/repositories"
+    # Larger values are silently capped by the API, which would end the
+    # `len(repositories) < per_page` pagination check after one page
+    per_page = min(per_page, MAX_PER_PAGE)
     query = f"{search_term} in:name,description,topics, pushed:>{last_year_date} stars:>10"
 
     params = {
@@ -233,7 +648,7 @@ def search_github_repos(
     while len(all_repositories) < MAX_RESP:
         params["page"] = page
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = github_get(url, params=params)
         except requests.RequestException as exc:
             logger.error("Request error while searching repositories: %s", exc)
             break
@@ -257,7 +672,7 @@ def search_github_repos(
             repo_id = repo["id"]
             if repo_id not in seen_repos:
                 seen_repos.add(repo_id)
-                all_repositories.append(repo)
+                all_repositories.append(project_repo(repo))
 
         logger.info(
             "Page %d loaded with %d repositories (%d unique accumulated).",
@@ -271,7 +686,6 @@ def search_github_repos(
             break
 
         page += 1
-        time.sleep(3)  # Avoid hitting API rate limits
 
     limited_results = all_repositories[:MAX_RESP]
     logger.info(
@@ -283,9 +697,15 @@ def search_github_repos(
     return limited_results
 
 
-def count_total_commits(owner: str, repo_name: str) -> int:
+def _count_commits_range(
+    owner: str, repo_name: str, label: str, extra_params: Optional[Dict] = None
+) -> Optional[int]:
     """
-    Count the total number of commits in a GitHub repository.
+    Count commits on the default branch using a single request.
+
+    With `per_page=1` every commit is one page, so the `page` number of the
+    `Link: rel="last"` header is the commit count; without that header the
+    history fits in the first page and its length is the count.
 
     Parameters
     ----------
@@ -293,43 +713,60 @@ def count_total_commits(owner: str, repo_name: str) -> int:
         Repository owner (GitHub username or organization).
     repo_name : str
         Repository name.
+    label : str
+        What is being counted, used in log messages (e.g., '2024 commits').
+    extra_params : dict, optional
+        Additional query parameters, such as `since` / `until`.
 
     Returns
     -------
-    int
-        Total number of commits in the repository.
+    int or None
+        Number of matching commits, or None in case of error.
     """
     commits_url = f"https://api.github.com/repos/{owner}/{repo_name}/commits"
-    params = {"per_page": 100}
-    total_commits = 0
-    page = 1
+    params = {**(extra_params or {}), "per_page": 1}
 
-    while True:
-        try:
-            response = requests.get(
-                commits_url, headers=headers, params={**params, "page": page}
-            )
-        except requests.RequestException as exc:
-            logger.error(
-                "Request error while fetching commits for %s: %s", repo_name, exc
-            )
-            break
+    try:
+        response = github_get(commits_url, params=params)
+    except requests.RequestException as exc:
+        logger.error(
+            "Request error while fetching %s for %s: %s", label, repo_name, exc
+        )
+        return None
 
-        if response.status_code == 200:
-            commits = response.json()
-            total_commits += len(commits)
-            if len(commits) < NUM_COMMITS:
-                break
-            page += 1
-        else:
-            logger.error(
-                "Error while fetching commits for %s: %s - %s",
-                repo_name,
-                response.status_code,
-                response.text,
-            )
-            break
+    if response.status_code != 200:
+        logger.error(
+            "Error while fetching %s for %s: %s - %s",
+            label,
+            repo_name,
+            response.status_code,
+            response.text,
+        )
+        return None
+
+    last = response.links.get("last")
+    if last:
+        return int(parse_qs(urlparse(last["url"]).query)["page"][0])
+    return len(response.json())
 
+
+def count_total_commits(owner: str, repo_name: str) -> int:
+    """
+    Count the total number of commits in a GitHub repository.
+
+    Parameters
+    ----------
+    owner : str
+        Repository owner (GitHub username or organization).
+    repo_name : str
+        Repository name.
+
+    Returns
+    -------
+    int
+        Total number of commits in the repository.
+    """
+    total_commits = _count_commits_range(owner, repo_name, "commits") or 0
     logger.debug("Total commits for %s/%s: %d", owner, repo_name, total_commits)
     return total_commits
 
@@ -350,50 +787,89 @@ def count_commits_2024(owner: str, repo_name: str) -> int:
     int
         Number of commits in 2024.
     """
-    commits_url = f"https://api.github.com/repos/{owner}/{repo_name}/commits"
-    params = {
-        "since": "2024-01-01T00:00:00Z",
-        "until": "2024-12-31T23:59:59Z",
-        "per_page": 100,
-    }
-    total_commits_2024 = 0
-    page = 1
+    total_commits_2024 = (
+        _count_commits_range(owner, repo_name, "2024 commits", COMMITS_2024_PARAMS) or 0
+    )
+    logger.debug(
+        "Total commits in 2024 for %s/%s: %d", owner, repo_name, total_commits_2024
+    )
+    return total_commits_2024
 
-    while True:
-        try:
-            response = requests.get(
-                commits_url, headers=headers, params={**params, "page": page}
+
+def graphql_commit_counts(repos: List[Dict]) -> Dict[str, Tuple[int, int]]:
+    """
+    Fetch total and 2024 commit counts for many repositories via GraphQL.
+
+    Up to `GRAPHQL_BATCH` repositories are aliased into one query, so each
+    HTTP round-trip resolves a whole batch instead of two REST requests per
+    repository. The GraphQL API requires an authenticated token.
+
+    Parameters
+    ----------
+    repos : list of dict
+        Repository records, as returned by `search_github_repos`.
+
+    Returns
+    -------
+    dict
+        `full_name -> (total_commits, commits_2024)` for every repository the
+        queries resolved. Failed batches or repositories are left out, so the
+        caller can fall back to the REST helpers.
+    """
+    counts: Dict[str, Tuple[int, int]] = {}
+
+    for start in range(0, len(repos), GRAPHQL_BATCH):
+        batch = repos[start:start + GRAPHQL_BATCH]
+        query = "query {" + "".join(
+            GRAPHQL_REPO_FRAGMENT.format(
+                index=i,
+                owner=json.dumps(repo["owner"]),
+                name=json.dumps(repo["name"]),
             )
+            for i, repo in enumerate(batch)
+        ) + "\n}"
+
+        try:
+            response = SESSION.post(GRAPHQL_URL, json={"query": query}, timeout=30)
         except requests.RequestException as exc:
-            logger.error(
-                "Request error while fetching 2024 commits for %s: %s", repo_name, exc
-            )
-            break
+            logger.error("Request error while querying GraphQL commit counts: %s", exc)
+            continue
 
-        if response.status_code == 200:
-            commits = response.json()
-            total_commits_2024 += len(commits)
-            if len(commits) < NUM_COMMITS:
-                break
-            page += 1
-        else:
+        if response.status_code != 200:
             logger.error(
-                "Error while fetching 2024 commits for %s: %s - %s",
-                repo_name,
+                "Error while querying GraphQL commit counts: %s - %s",
                 response.status_code,
                 response.text,
             )
-            break
+            continue
+
+        data = response.json().get("data") or {}
+        for i, repo in enumerate(batch):
+            node = data.get(f"r{i}")
+            if node is None:
+                continue
+            branch = node.get("defaultBranchRef")
+            if branch is None:
+                # Empty repository: no default branch, hence no commits
+                counts[repo["full_name"]] = (0, 0)
+                continue
+            target = branch["target"]
+            counts[repo["full_name"]] = (
+                target["total"]["totalCount"],
+                target["y2024"]["totalCount"],
+            )
 
-    logger.debug(
-        "Total commits in 2024 for %s/%s: %d", owner, repo_name, total_commits_2024
-    )
-    return total_commits_2024
+    logger.debug("GraphQL commit counts resolved for %d repositories.", len(counts))
+    return counts
 
 
-def get_collaborators_count(owner: str, repo_name: str) -> int:
+def _count_collaborators(owner: str, repo_name: str) -> Optional[int]:
     """
-    Count the number of collaborators (contributors) in a GitHub repository.
+    Count the contributors listed on the first page of the contributors API.
+
+    Only the count is needed, so contributors are requested one per page and
+    the `Link: rel="last"` page number is read instead of decoding a page of
+    up to `MAX_PER_PAGE` objects; the count keeps the first-page cap.
 
     Parameters
     ----------
@@ -404,24 +880,29 @@ def get_collaborators_count(owner: str, repo_name: str) -> int:
 
     Returns
     -------
-    int
-        Number of collaborators (contributors), or 0 in case of error.
+    int or None
+        Number of collaborators (contributors), or None in case of error.
     """
     collaborators_url = (
         f"https://api.github.com/repos/{owner}/{repo_name}/contributors"
     )
-    params = {"per_page": 100}
+    params = {"per_page": 1}
 
     try:
-        response = requests.get(collaborators_url, headers=headers, params=params)
+        response = github_get(collaborators_url, params=params)
     except requests.RequestException as exc:
         logger.error(
             "Request error while fetching collaborators for %s: %s", repo_name, exc
         )
-        return 0
+        return None
 
     if response.status_code == 200:
-        collaborators = len(response.json())
+        last = response.links.get("last")
+        if last:
+            last_page = int(parse_qs(urlparse(last["url"]).query)["page"][0])
+            collaborators = min(last_page, MAX_PER_PAGE)
+        else:
+            collaborators = len(response.json())
         logger.debug("Collaborators for %s/%s: %d", owner, repo_name, collaborators)
         return collaborators
     else:
@@ -431,10 +912,29 @@ def get_collaborators_count(owner: str, repo_name: str) -> int:
             response.status_code,
             response.text,
         )
-        return 0
+        return None
 
 
-def search_and_save_management(term: str) -> None:
+def get_collaborators_count(owner: str, repo_name: str) -> int:
+    """
+    Count the number of collaborators (contributors) in a GitHub repository.
+
+    Parameters
+    ----------
+    owner : str
+        Repository owner (GitHub username or organization).
+    repo_name : str
+        Repository name.
+
+    Returns
+    -------
+    int
+        Number of collaborators (contributors), or 0 in case of error.
+    """
+    return _count_collaborators(owner, repo_name) or 0
+
+
+def search_and_save_management(term: str, timestamp: Optional[str] = None) -> None:
     """
     Perform GitHub search for a given term and save the results to a CSV file.
 
@@ -442,6 +942,8 @@ def search_and_save_management(term: str) -> None:
     ----------
     term : str
         Search term to be used in the GitHub Search API.
+    timestamp : str, optional
+        Timestamp for the output CSV filename (see `HandleCsv`).
     """
     logger.info("Searching repositories for term '%s'...", term)
 
@@ -450,7 +952,7 @@ def search_and_save_management(term: str) -> None:
         logger.warning("No repositories found for term '%s'.", term)
         return
 
-    handler = HandleCsv(repos, term, prefix="RAW_")
+    handler = HandleCsv(repos, term, prefix="RAW_", timestamp=timestamp)
     handler.handling_to_save()
 
 
@@ -460,7 +962,8 @@ def main() -> None:
 
     Iterates over a predefined list of EdgeAI-related search terms, retrieves
     repositories from GitHub, and stores the results as CSV files in
-    `dataset/raw_data`.
+    `dataset/raw_data`. Up to `TERM_WORKERS` terms are mined concurrently,
+    sharing the pooled session, the rate-limit state and the metrics cache.
     """
     search_terms = [
         "edge ai",
@@ -489,10 +992,18 @@ def main() -> None:
         "edge_ai_architecture",
     ]
 
+    # Skip terms that repeat after case/whitespace normalization. Spelling
+    # variants ("edge ai" / "edgeai" / "edge_ai") are kept: GitHub tokenizes
+    # them differently, and repos they share are served by the metrics cache.
+    search_terms = list(dict.fromkeys(" ".join(t.lower().split()) for t in search_terms))
+
     logger.info("Starting GitHub mining for %d search terms.", len(search_terms))
+    # One timestamp for every RAW_ CSV written by this run
+    timestamp = format_datetime()
 
-    for term in search_terms:
-        search_and_save_management(term)
+    with ThreadPoolExecutor(max_workers=TERM_WORKERS) as executor:
+        # list() re-raises any exception from a worker
+        list(executor.map(search_and_save_management, search_terms, repeat(timestamp)))
 
     logger.info("GitHub mining process completed for all terms.")
 
@@ -1,9 +1,12 @@
 import csv
 import logging
 import os
-from typing import List, Dict, Optional
+import re
+from typing import Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 from langdetect import detect, LangDetectException
 
 from utils import format_datetime, Menu
@@ -12,44 +15,116 @@ logger = logging.getLogger(__name__)
 
 ROOT = os.getcwd()
 
+# Where every processing step reads its input from and writes its output to
+PROCESSED_DATA_DIR = os.path.join(ROOT, "dataset", "processed_data")
+
 list_file = Menu.list_files_2_menu
 recursive_list = Menu.recursive_folder_navigation
 
+# Repositories whose name, description or search terms contain any of these
+# (case-insensitive substring) are dropped by `filter_repos_by_exclusion_terms`
+EXCLUSION_TERMS = frozenset({
+    "courses", "toy", "tutorial", "classes", "books", "book",
+    "guidelines", "tools", "tool", "demos", "demo", "simulator",
+    "simulators", "class", "course", "toys", "cutting-edge", "library",
+    "cuttingedge", "cutting_edge", "cutting edge",
+})
+
+# All exclusion terms as one alternation, so each text is scanned once by
+# the regex engine instead of once per term
+EXCLUSION_PATTERN = re.compile("|".join(map(re.escape, sorted(EXCLUSION_TERMS))))
+
+# Matches texts with at least 3 ASCII letters; anything shorter cannot be
+# told apart as English, so langdetect is not called for it
+MIN_LATIN_TEXT = re.compile(r"[A-Za-z](?:[^A-Za-z]*[A-Za-z]){2}")
+
+# Rows read (and written) at a time by `filter_english_descriptions`
+ENGLISH_FILTER_CHUNK_ROWS = 50_000
 
-def concat_csv_files(folder_path: str) -> None:
+
+def concat_csv_files(folder_path: str, timestamp: Optional[str] = None) -> None:
     """
     Reads CSV files in a folder, adds a 'Keyword' column with a keyword extracted from the file name,
     and saves all the concatenated data into a new CSV file.
 
+    When every file has the same header (the case for `api_search.py` output), the rows are
+    streamed into the output file without being parsed; otherwise the files are loaded with
+    pandas and concatenated, aligning differing columns.
+
     Args:
         folder_path (str): Path to the folder containing the CSV files.
+        timestamp (Optional[str]): Timestamp for the output filename. If None, the current one.
     """
-    lista_dfs = []
-
     # Iterates over the files in the folder and processes only CSV files
+    csv_paths = []
+    headers = set()
     for file_name in os.listdir(folder_path):
         if file_name.endswith('.csv'):
             file_path = os.path.join(folder_path, file_name)
             print(f"Processing file: {file_name}")
 
             try:
-                # Reads the CSV file and adds the 'Keyword' column
-                df = pd.read_csv(file_path)
-                lista_dfs.append(df)
-            except Exception as e:
+                with open(file_path, 'rb') as src:
+                    header = src.readline().rstrip(b'\r\n')
+            except OSError as e:
                 print(f"Error reading file {file_name}: {e}")
-    # Concatenate DataFrames and save to a new CSV file
-    if lista_dfs:
-        folder_name = folder_path.split('/')[-1]
-        df_concat = pd.concat(lista_dfs, ignore_index=True)
-        output_folder = f"dataset/processed_data"
-        os.makedirs(output_folder, exist_ok=True)
-        output_file = os.path.join(output_folder, f"[CONCATENATED]-{folder_name}-{format_datetime()}.csv")
-
-        df_concat.to_csv(output_file, index=False)
-        print(f"Concatenated file & saved in: {output_file}")
-    else:
+                continue
+            if not header:
+                print(f"Error reading file {file_name}: No columns to parse from file")
+                continue
+            csv_paths.append(file_path)
+            headers.add(header)
+
+    if not csv_paths:
         print("No CSV file processed.")
+        return
+
+    folder_name = folder_path.split('/')[-1]
+    os.makedirs(PROCESSED_DATA_DIR, exist_ok=True)
+    output_file = os.path.join(PROCESSED_DATA_DIR, f"[CONCATENATED]-{folder_name}-{timestamp or format_datetime()}.csv")
+
+    if len(headers) == 1:
+        _stream_concat(csv_paths, output_file)
+    else:
+        lista_dfs = []
+        for file_path in csv_paths:
+            try:
+                lista_dfs.append(pd.read_csv(file_path))
+            except Exception as e:
+                print(f"Error reading file {os.path.basename(file_path)}: {e}")
+        if not lista_dfs:
+            print("No CSV file processed.")
+            return
+        pd.concat(lista_dfs, ignore_index=True).to_csv(output_file, index=False)
+    print(f"Concatenated file & saved in: {output_file}")
+
+
+def _stream_concat(csv_paths: List[str], output_file: str) -> None:
+    """
+    Write the shared header once, then copy the data rows of every file in order.
+
+    Memory use is bounded by the copy buffer instead of the size of the dataset.
+    """
+    eol = b'\n'
+    with open(output_file, 'wb') as out:
+        for i, file_path in enumerate(csv_paths):
+            with open(file_path, 'rb') as src:
+                header = src.readline()
+                if i == 0:
+                    # Keep the line ending ('\n' or '\r\n') used by the input files
+                    eol = header[len(header.rstrip(b'\r\n')):] or eol
+                    out.write(header.rstrip(b'\r\n') + eol)
+                # Copy, and terminate the last row so the next file starts on its own line
+                last = b''
+                while True:
+                    block = src.read(1 << 20)
+                    if not block:
+                        break
+                    out.write(block)
+                    last = block
+                if last and not last.endswith(b'\n'):
+                    out.write(eol)
+
 
 def get_valid_option(valid_options):
     """
@@ -73,10 +148,11 @@ def get_valid_option(valid_options):
 
 def handle_concatenate():
     """Handle the concatenation of files."""
+    timestamp = format_datetime()
     dataset_folder = f"{ROOT}/dataset"
     data_path = recursive_list(dataset_folder, "Folder")
     logger.info("Selected path for concatenation: %s", data_path)
-    concat_csv_files(data_path)
+    concat_csv_files(data_path, timestamp)
     # concat(data_path)
 
 
@@ -85,8 +161,8 @@ def handle_remove_duplicates():
     path = recursive_list(ROOT, "Folder")
     file_name = list_file(path, "File")
     file_out_name = f"[NO-DUPLICATED]_repo-files_{format_datetime()}.csv"
-    input_file = os.path.join(ROOT, "dataset/processed_data", file_name)
-    output_file = os.path.join(ROOT, "dataset/processed_data", file_out_name)
+    input_file = os.path.join(PROCESSED_DATA_DIR, file_name)
+    output_file = os.path.join(PROCESSED_DATA_DIR, file_out_name)
 
     try:
         remove_duplicates(input_file, output_file)
@@ -101,8 +177,8 @@ def handle_filter_descriptions():
     file_name = list_file(path, "File")
 
     file_out_name = f"[ENGLISH-DESC]_repo-files_{format_datetime()}.csv"
-    input_file = os.path.join(ROOT, "dataset/processed_data", file_name)
-    output_file = os.path.join(ROOT, "dataset/processed_data", file_out_name)
+    input_file = os.path.join(PROCESSED_DATA_DIR, file_name)
+    output_file = os.path.join(PROCESSED_DATA_DIR, file_out_name)
 
     try:
         filter_english_descriptions(input_file, output_file)
@@ -111,11 +187,15 @@ def handle_filter_descriptions():
         logger.exception("Failed to filter descriptions: %s", exc)
 
 
-def _read_csv_safe(file_path: str) -> pd.DataFrame:
-    """Read CSV with sane defaults and clear error if the file is missing/corrupt."""
+def _read_csv_safe(file_path: str, **read_kwargs):
+    """
+    Read CSV with sane defaults and clear error if the file is missing/corrupt.
+
+    Extra keyword arguments go to `pd.read_csv` (e.g. `chunksize` for a chunk iterator).
+    """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"CSV not found: {file_path}")
-    return pd.read_csv(file_path)
+    return pd.read_csv(file_path, **read_kwargs)
 
 
 def remove_duplicates(input_file: str, output_file: str) -> None:
@@ -145,6 +225,18 @@ def remove_duplicates(input_file: str, output_file: str) -> None:
     logger.info("File saved without duplicates at '%s'.", output_file)
 
 
+def _is_english(description: str) -> bool:
+    """Return True if langdetect classifies a non-blank description as English."""
+    if not MIN_LATIN_TEXT.search(description):
+        # Blank, symbols/digits only or non-Latin script: never English
+        return False
+    try:
+        return detect(description) == "en"
+    except LangDetectException:
+        # Ignore rows with empty/undetectable descriptions
+        return False
+
+
 def filter_english_descriptions(input_file: str, output_file: str) -> None:
     """
     Read a CSV file, keep only rows whose 'desc.' language is English, and save to output.
@@ -152,51 +244,85 @@ def filter_english_descriptions(input_file: str, output_file: str) -> None:
     :param input_file: Path to the input CSV file.
     :param output_file: Path to the filtered CSV file (English descriptions only).
     """
-    df = _read_csv_safe(input_file)
-
-    if "desc." not in df.columns:
-        logger.warning(
-            "Column 'desc.' was not found. Saving empty file to preserve pipeline behavior."
-        )
-        pd.DataFrame(columns=df.columns).to_csv(output_file, index=False)
-        return
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-    english_rows = []
-    for _, row in df.iterrows():
-        description = "" if pd.isna(row["desc."]) else str(row["desc."])
-        if not description.strip():
-            continue
-        try:
-            if detect(description) == "en":
-                english_rows.append(row)
-        except LangDetectException:
-            # Ignore rows with empty/undetectable descriptions
-            continue
+    # Descriptions repeat across search terms, so each distinct text is only
+    # detected once (across all chunks) and the result is broadcast back as a
+    # row mask. Chunks are appended as they are filtered, so memory stays
+    # bounded by ENGLISH_FILTER_CHUNK_ROWS. Values are read as strings, so no
+    # column changes type (or text form) from one chunk to the next; pandas'
+    # NA tokens are still read as missing, keeping "None"/"NA" descriptions
+    # out of language detection.
+    is_english: Dict[str, bool] = {}
+    with _read_csv_safe(input_file, chunksize=ENGLISH_FILTER_CHUNK_ROWS, dtype=str) as reader:
+        for i, chunk in enumerate(reader):
+            if "desc." not in chunk.columns:
+                logger.warning(
+                    "Column 'desc.' was not found. Saving empty file to preserve pipeline behavior."
+                )
+                pd.DataFrame(columns=chunk.columns).to_csv(output_file, index=False)
+                return
+
+            descriptions = chunk["desc."].fillna("")
+            for text in descriptions.unique():
+                if text not in is_english:
+                    is_english[text] = _is_english(text)
+            mask = descriptions.map(is_english).to_numpy(dtype=bool)
+            chunk.loc[mask].to_csv(
+                output_file, mode="w" if i == 0 else "a", header=i == 0, index=False
+            )
 
-    df_english = pd.DataFrame(english_rows)
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    df_english.to_csv(output_file, index=False)
     logger.info("File saved with English descriptions at '%s'.", output_file)
 
 
-def load_repos_from_csv(file_path: str) -> List[Dict]:
+def _read_csv_as_strings(file_path: str) -> pd.DataFrame:
+    """
+    Read every column as its raw string ('' for empty cells).
+
+    Uses pyarrow's multithreaded CSV parser over a memory-mapped file (no copy through
+    Python file buffers); falls back to pandas when the header has repeated names
+    (pandas de-duplicates them) or pyarrow rejects the file.
+    """
+    with open(file_path, mode="r", encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f), [])
+
+    if header and len(set(header)) == len(header):
+        try:
+            with pa.memory_map(file_path, "r") as source:
+                table = pv.read_csv(
+                    source,
+                    parse_options=pv.ParseOptions(newlines_in_values=True),
+                    convert_options=pv.ConvertOptions(
+                        column_types=dict.fromkeys(header, pa.string()),
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ),
+                )
+            return table.to_pandas()
+        except pa.ArrowInvalid as exc:
+            logger.debug("[CSV] pyarrow could not parse %s (%s); using pandas.", file_path, exc)
+
+    return pd.read_csv(
+        file_path, dtype=str, keep_default_na=False, encoding="utf-8-sig", memory_map=True
+    )
+
+
+def load_repos_from_csv(file_path: str) -> pd.DataFrame:
     """
     Load repositories from a single CSV file.
 
     Expected columns (min): 'name', 'desc.', 'search_term'
+    - Every value is kept as the raw string found in the file ('' when empty).
     - 'search_term' may contain comma-separated values; we'll split and strip.
     """
-    repos: List[Dict] = []
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"CSV not found: {file_path}")
 
-    with open(file_path, mode="r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            raw_terms = row.get("search_term") or ""
-            terms = [t.strip() for t in raw_terms.split(",")] if raw_terms else []
-            row["search_term"] = terms
-            repos.append(row)
+    repos = _read_csv_as_strings(file_path)
+    raw_terms = repos.get("search_term", pd.Series("", index=repos.index))
+    repos["search_term"] = raw_terms.map(
+        lambda raw: [t.strip() for t in raw.split(",")] if raw else []
+    )
     logger.info("[CSV] Loaded %d repositories from %s", len(repos), file_path)
     return repos
 
@@ -204,23 +330,26 @@ def load_repos_from_csv(file_path: str) -> List[Dict]:
 def filter_repos_by_exclusion_terms(
     output_path: Optional[str] = None,
     term: Optional[str] = None,
+    timestamp: Optional[str] = None,
 ) -> Optional[str]:
     """
     Filter a SINGLE CSV file by exclusion terms and save the result.
 
     Args:
-        output_path: directory for the filtered CSV. If None, uses ROOT/dataset/processed_data.
+        output_path: directory for the filtered CSV. If None, uses PROCESSED_DATA_DIR.
         term: label used in the output filename (e.g., the search seed). If None, inferred from filename.
+        timestamp: timestamp for the output filename. If None, taken when the filter starts.
 
     Returns:
         The saved CSV filepath, or None if there was nothing to save.
     """
-    folder_path = f"{ROOT}/dataset/processed_data"
-    file_path = list_file(folder_path, "File")  # kept as-is to preserve current behavior
+    if timestamp is None:
+        timestamp = format_datetime()
+    file_path = list_file(PROCESSED_DATA_DIR, "File")  # kept as-is to preserve current behavior
 
     # Default output dir
     if output_path is None:
-        output_path = f"{ROOT}/dataset/processed_data"
+        output_path = PROCESSED_DATA_DIR
     os.makedirs(output_path, exist_ok=True)
 
     # Try to infer 'term' from filename if not provided
@@ -230,29 +359,19 @@ def filter_repos_by_exclusion_terms(
         term = tokens[1] if len(tokens) >= 2 else tokens[0]
         logger.debug("[Filter] Inferred term '%s' from filename '%s'", term, base)
 
-    exclusion_terms = {
-        "courses", "toy", "tutorial", "classes", "books", "book",
-        "guidelines", "tools", "tool", "demos", "demo", "simulator",
-        "simulators", "class", "course", "toys", "cutting-edge", "library",
-        "cuttingedge", "cutting_edge", "cutting edge",
-    }
-
     repos = load_repos_from_csv(file_path)
 
-    def _concat_text(repo: Dict) -> str:
-        name = repo.get("name") or ""
-        desc = repo.get("desc.") or ""
-        terms_txt = " ".join(repo.get("search_term", []) or [])
-        return f"{name} {desc} {terms_txt}".lower()
-
-    filtered_repos: List[Dict] = []
-    for repo in repos:
-        haystack = _concat_text(repo)
-        if any(term_ex in haystack for term_ex in exclusion_terms):
-            continue
-        filtered_repos.append(repo)
+    # One lowercased "name desc terms" text per repository, matched against
+    # the whole column at once
+    text_cols = repos.reindex(columns=["name", "desc."], fill_value="")
+    haystack = (
+        text_cols["name"]
+        .str.cat([text_cols["desc."], repos["search_term"].str.join(" ")], sep=" ")
+        .str.lower()
+    )
+    filtered_repos = repos.loc[~haystack.str.contains(EXCLUSION_PATTERN)]
 
-    saved = save_filtered_repository(filtered_repos, output_path, term)
+    saved = save_filtered_repository(filtered_repos, output_path, term, timestamp)
     logger.info(
         "[Filter] Input: %d repos | Filtered: %d repos | Saved: %s",
         len(repos),
@@ -263,27 +382,27 @@ def filter_repos_by_exclusion_terms(
 
 
 def save_filtered_repository(
-    repos: List[Dict],
+    repos: pd.DataFrame,
     output_path: str,
     term: str,
+    timestamp: Optional[str] = None,
 ) -> Optional[str]:
     """
-    Persist filtered repositories to CSV.
+    Persist filtered repositories to CSV, with columns in sorted order.
     Returns the saved filepath or None if nothing to save.
+    `timestamp` goes into the filename (the current one if None).
     """
-    if not repos:
+    if repos.empty:
         logger.warning("[Save] No repositories to save after filtering.")
         return None
 
-    filename = f"[EXCLUSION-TERM]_{term}_{format_datetime()}.csv"
+    filename = f"[EXCLUSION-TERM]_{term}_{timestamp or format_datetime()}.csv"
     file_path = os.path.join(output_path, filename)
 
-    # Collect all keys across repos to keep columns stable
-    keys = sorted({k for repo in repos for k in repo.keys()})
-    with open(file_path, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        writer.writerows(repos)
+    # Sorted columns and CRLF rows, as the csv.DictWriter output always had
+    repos[sorted(repos.columns)].to_csv(
+        file_path, index=False, encoding="utf-8", lineterminator="\r\n"
+    )
 
     logger.info("[Save] Filtered repositories saved to '%s'", file_path)
     return file_path
@@ -6,8 +6,14 @@ ROOT = os.getcwd()
 
 
 def format_datetime() -> str:
-    """Return the current datetime formatted for use in filenames."""
-    return datetime.now().strftime("%Y-%m-%d_%H:%M:%S")
+    """
+    Return the current datetime formatted for use in filenames.
+
+    Callers take it once per operation and pass it down, so the files written by one
+    operation share a timestamp. Uses '-' as the time separator, since ':' is not
+    allowed in Windows filenames.
+    """
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
 
 class Menu:
@@ -0,0 +1,52 @@
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_collection"))
+
+import api_search as a  # noqa: E402
+
+
+class PaceTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(a, _rate_state={}, _next_send={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_concurrently(self, callers: int) -> list:
+        sleeps, lock = [], threading.Lock()
+
+        def record(seconds):
+            with lock:
+                sleeps.append(seconds)
+
+        with mock.patch.object(a.time, "time", return_value=990.0), \
+                mock.patch.object(a.time, "sleep", record):
+            threads = [threading.Thread(target=a._pace, args=("core",)) for _ in range(callers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        return sorted(sleeps)
+
+    def test_concurrent_callers_get_distinct_slots(self):
+        # 10 requests left, window resets in 10s
+        a._rate_state["core"] = (10, 1000.0)
+        sleeps = self._run_concurrently(16)
+
+        self.assertEqual(len(sleeps), 16)
+        self.assertEqual(len(set(sleeps[:10])), 10)
+        self.assertTrue(all(s <= 10.0 + 1e-9 for s in sleeps))
+        self.assertEqual(sleeps[10:], [10.0] * 6)  # over budget: wait for the reset
+        self.assertEqual(a._rate_state["core"], (-6, 1000.0))
+
+    def test_no_pause_above_the_floor(self):
+        a._rate_state["core"] = (a.RATE_LIMIT_FLOOR + 20, 1000.0)
+        self.assertEqual(self._run_concurrently(8), [])
+        self.assertEqual(a._rate_state["core"], (a.RATE_LIMIT_FLOOR + 12, 1000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
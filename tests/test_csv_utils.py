@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_analysis", "scripts"))
+
+from csv_utils import read_csv_columns  # noqa: E402
+
+
+class ReadCsvColumnsTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_multiline_cells_beyond_one_arrow_block(self):
+        # ~3 MB with a multi-line cell on every row, so Arrow's ~1 MB block
+        # boundaries fall inside quoted values (pd.read_csv(engine="pyarrow")
+        # raises ParserError on this file)
+        rows = ['id,domain,"desc."']
+        for i in range(60_000):
+            rows.append(f'{i},IIoT {i % 5},"first line {i}\nsecond, line {i}"')
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write("\n".join(rows) + "\n")
+
+        got = read_csv_columns(self.path, ["domain", "desc."])
+        expected = pd.read_csv(self.path, usecols=["domain", "desc."])
+        pd.testing.assert_frame_equal(got, expected)
+
+    def test_matches_pandas_pyarrow_engine(self):
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write("a,b,c,d\n1,x,,None\n2,<NA>,,y\n")
+        pd.testing.assert_frame_equal(
+            read_csv_columns(self.path), pd.read_csv(self.path, engine="pyarrow")
+        )
+
+    def test_missing_strings_are_nan(self):
+        # As with the default engine: str() of a missing cell is "nan", not "None"
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write("cap,n\nx,1\n,2\nNone,3\n")
+        got = read_csv_columns(self.path)
+        self.assertEqual(got["cap"].astype(str).tolist(), ["x", "nan", "nan"])
+        pd.testing.assert_frame_equal(got, pd.read_csv(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_collection"))
+
+import data_treatment as dt  # noqa: E402
+
+ENGLISH = "A lightweight framework for running machine learning models on edge devices"
+
+
+class FilterEnglishDescriptionsTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.input_file = os.path.join(self.dir.name, "in.csv")
+        self.output_file = os.path.join(self.dir.name, "out", "en.csv")
+
+    def _run(self, text: str) -> str:
+        with open(self.input_file, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        dt.filter_english_descriptions(self.input_file, self.output_file)
+        with open(self.output_file, encoding="utf-8", newline="") as f:
+            return f.read()
+
+    def test_header_only_input(self):
+        self.assertEqual(self._run("name,desc.,stars\r\n"), "name,desc.,stars\n")
+
+    def test_values_keep_their_text_across_chunks(self):
+        # 'stars' gets a missing value and 'code' a non-numeric one only in
+        # the second chunk; neither may change how the first chunk is written
+        text = (
+            "name,desc.,stars,code\n"
+            f"a,{ENGLISH},3,007\n"
+            "b,,4,01\n"
+            f"c,{ENGLISH},,x\n"
+            "d,None,5,NA\n"
+        )
+        with mock.patch.object(dt, "ENGLISH_FILTER_CHUNK_ROWS", 2):
+            out = self._run(text)
+        self.assertEqual(
+            out,
+            "name,desc.,stars,code\n"
+            f"a,{ENGLISH},3,007\n"
+            f"c,{ENGLISH},,x\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
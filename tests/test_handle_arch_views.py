@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_analysis", "scripts"))
+
+import handle_arch_views as h  # noqa: E402
+
+
+class IterColumnChunksTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def _write(self, text: str) -> Path:
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return Path(self.path)
+
+    def _baseline(self) -> pd.DataFrame:
+        return pd.read_csv(self.path, dtype=object, keep_default_na=True,
+                           na_values=["", "NA", "NaN", "null", "None"])
+
+    def test_quoted_newline_across_block_boundary(self):
+        rows = ["arch_overview,diagrams"]
+        for i in range(200):
+            rows.append(f'"first line {i}\nsecond line {i}",yes' if i % 3 == 0 else f"v{i},")
+        path = self._write("\n".join(rows) + "\n")
+
+        # Blocks far smaller than the file force quoted cells across boundaries
+        chunks = list(h.iter_column_chunks(path, ",", h.COLUMNS, block_size=256))
+        self.assertGreater(len(chunks), 1)
+
+        got = h.coverage_from_chunks(chunks, h.COLUMNS)
+        expected = h.compute_coverage(self._baseline(), h.COLUMNS)
+        pd.testing.assert_frame_equal(got, expected)
+
+    def test_pandas_na_tokens_count_as_empty(self):
+        path = self._write("arch_overview,diagrams\n<NA>,None\nx,NA\n")
+        got = h.coverage_from_chunks(h.iter_column_chunks(path, ",", h.COLUMNS), h.COLUMNS)
+        expected = h.compute_coverage(self._baseline(), h.COLUMNS)
+        pd.testing.assert_frame_equal(got, expected)
+        self.assertEqual(got.set_index("column").loc["arch_overview", "count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
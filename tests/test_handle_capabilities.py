@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_analysis", "scripts"))
+
+import handle_capabilities as h  # noqa: E402
+
+
+class SplitLayersTest(unittest.TestCase):
+    # Expected values are the outputs of the NFKD-based normalization the
+    # translate table replaced: "↔" is dropped, not used as a separator
+    CASES = {
+        "Edge↔Fog": None,
+        "Edge ↔ Fog": ["Edge", "Fog"],
+        "Fog/Cloud ↔ Edge": ["Edge", "Fog", "Cloud"],
+        "Borda ↔ Névoa": ["Edge"],
+        "Edge/Fog": ["Edge", "Fog"],
+    }
+
+    def test_double_arrow_is_dropped(self):
+        for raw, expected in self.CASES.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(h.split_layers(raw), expected)
+
+    def test_series_matches_scalar(self):
+        raw = pd.Series(list(self.CASES))
+        self.assertEqual(h.split_layers_series(raw).tolist(), list(self.CASES.values()))
+
+
+class MakeTablesTest(unittest.TestCase):
+    def test_unused_categories_are_listed_with_zero(self):
+        long_df = pd.DataFrame({
+            "iso": pd.Categorical(["Interface Capability", "Data Capabilities"],
+                                  categories=h.ISO_CANON, ordered=True),
+            "layer": pd.Categorical(["Edge", "Edge"], categories=h.LAYER_CANON, ordered=True),
+            "weight": [1.0, 3.0],
+        })
+        tables = h.make_tables(long_df)
+
+        by_iso = tables["by_iso"]
+        self.assertEqual(by_iso["iso"].tolist(), h.ISO_CANON)
+        self.assertEqual(by_iso["count"].tolist(), [1.0, 3.0, 0.0])
+        self.assertEqual(by_iso["percent"].tolist(), [25.0, 75.0, 0.0])
+
+        by_layer = tables["by_layer"]
+        self.assertEqual(by_layer["layer"].tolist(), h.LAYER_CANON)
+        self.assertEqual(by_layer["count"].tolist(), [0.0, 4.0, 0.0, 0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
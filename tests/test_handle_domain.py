@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import unicodedata
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_analysis", "scripts"))
+
+import handle_domain as h  # noqa: E402
+
+
+class WriteTextCsvTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def assert_matches_pandas(self, df: pd.DataFrame) -> None:
+        out = os.path.join(self.dir.name, "out.csv")
+        ref = os.path.join(self.dir.name, "ref.csv")
+        h.write_text_csv(df, out)
+        df.to_csv(ref, index=False)
+        with open(out, encoding="utf-8") as a, open(ref, encoding="utf-8") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_text_columns(self):
+        self.assert_matches_pandas(pd.DataFrame({"repo_ID": ["r1", "r2"], "domain": ["Health", "Agriculture"]}))
+
+    def test_value_needing_quotes(self):
+        self.assert_matches_pandas(pd.DataFrame({"repo_ID": ["r1"], "domain": ["Smart Cities, Transport"]}))
+
+    def test_mixed_type_object_column(self):
+        # Arrow raises ArrowTypeError converting this column
+        self.assert_matches_pandas(pd.DataFrame({"repo_ID": [1, "r2"], "domain": ["Health", "Retail"]}))
+
+
+class StripAccentsTest(unittest.TestCase):
+    def test_matches_combining_filter(self):
+        for s in ["Saúde", "Ñandú", "Agricultura de precisão", "ﬁnance", "Ελληνικά", "ascii"]:
+            with self.subTest(s=s):
+                expected = "".join(
+                    c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c)
+                )
+                self.assertEqual(h._strip_accents(s), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
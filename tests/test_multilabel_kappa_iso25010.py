@@ -0,0 +1,45 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "data_analysis", "scripts"))
+
+import multilabel_kappa_iso25010 as k  # noqa: E402
+
+
+class OutputRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def test_untouched_columns_keep_their_text(self):
+        src = os.path.join(self.dir.name, "in.csv")
+        out = os.path.join(self.dir.name, "out.csv")
+        with open(src, "w", encoding="utf-8", newline="") as f:
+            f.write(
+                "id,coded_at,QR_R1,QR_R2\n"
+                "1,2024-01-05T10:00:00Z,Security,Security; Reliability\n"
+                "2,2024-01-06T11:30:00Z,Compatibility,Compatibility\n"
+            )
+        argv = ["multilabel_kappa_iso25010.py", "--input", src, "--output", out]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()):
+            k.main()
+
+        written = pd.read_csv(out, dtype=str)
+        self.assertEqual(
+            written["coded_at"].tolist(), ["2024-01-05T10:00:00Z", "2024-01-06T11:30:00Z"]
+        )
+        self.assertEqual(
+            list(written.columns),
+            ["id", "coded_at", "QR_R1", "QR_R2", "R1_list", "R2_list", "R1_normalized", "R2_normalized"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()